@@ -9,21 +9,39 @@ Primary interface: Parallel Chat API (OpenAI-compatible) for search and research
 Secondary interface: Extract API for URL verification and special cases.
 
 Main classes:
-  - ParallelChat:         Core Chat API client (base/core models)
+  - ParallelChat:         Core Chat API client (base/core models, sync and async)
   - ParallelSearch:       Web search via Chat API (base model)
   - ParallelDeepResearch: Deep research via Chat API (core model)
   - ParallelExtract:      URL content extraction (Extract API, verification only)
 
 Environment variable required:
   PARALLEL_API_KEY - Your Parallel API key from https://platform.parallel.ai
+
+Optional:
+  PARALLEL_WEB_CACHE_DIR - Where Chat API responses are cached
+                           (default: ~/.cache/parallel_web)
+  PARALLEL_WEB_SOCKET    - Unix socket of a running `daemon`
+                           (default: ~/.cache/parallel_web/daemon.sock)
+  PARALLEL_WEB_USE_DAEMON - Set to 1 to forward search/extract/research
+                           calls to that daemon (default: off)
+  PARALLEL_WEB_MAX_RETRIES - Retries for rate-limited (429), 5xx and
+                           connection failures (default: 5)
+  PARALLEL_WEB_WORKERS   - Threads behind query_in_executor() (default: 16)
 """
 
 import os
 import sys
 import json
+import time
 import argparse
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import functools
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson  # optional: faster JSON decoding of API responses and --json output
+except ImportError:
+    orjson = None
 
 
 def _get_api_key():
@@ -38,8 +56,189 @@ def _get_api_key():
     return api_key
 
 
+def _orjson_transport(transport, asynchronous: bool = False):
+    """Wrap an httpx transport so its responses decode JSON with orjson.
+
+    The OpenAI SDK parses every body via httpx.Response.json(); returning a
+    Response subclass from the transport swaps in the faster parser without
+    touching the SDK. Deep-research bodies with large basis arrays benefit most.
+    """
+    import httpx
+
+    class OrjsonResponse(httpx.Response):
+        def json(self, **kwargs: Any) -> Any:
+            if kwargs:
+                return super().json(**kwargs)
+            return orjson.loads(self.content)
+
+    def rewrap(response, request):
+        return OrjsonResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    if asynchronous:
+        class AsyncOrjsonTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                return rewrap(await transport.handle_async_request(request), request)
+
+            async def aclose(self):
+                await transport.aclose()
+
+        return AsyncOrjsonTransport()
+
+    class OrjsonTransport(httpx.BaseTransport):
+        def handle_request(self, request):
+            return rewrap(transport.handle_request(request), request)
+
+        def close(self):
+            transport.close()
+
+    return OrjsonTransport()
+
+
+def _make_http_client(asynchronous: bool = False):
+    """Build the httpx client that backs the Chat API SDK clients.
+
+    Deep-research calls can run for minutes, so the read timeout is generous
+    while connects fail fast. HTTP/2 is used when the optional 'h2' package
+    is installed (pip install "httpx[http2]"), letting concurrent queries
+    share one connection; otherwise httpx falls back to pooled HTTP/1.1.
+    Responses are decoded with orjson when it is installed.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    timeout = httpx.Timeout(600.0, connect=10.0)
+
+    if asynchronous:
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        client_class = httpx.AsyncClient
+    else:
+        transport = httpx.HTTPTransport(http2=http2, limits=limits)
+        client_class = httpx.Client
+
+    if orjson is not None:
+        transport = _orjson_transport(transport, asynchronous)
+    return client_class(transport=transport, timeout=timeout)
+
+
+# Chat API calls that fail with 408/409/429/5xx or a connection error are
+# retried by the openai SDK with jittered exponential backoff, honouring any
+# Retry-After header, so one flaky response doesn't sink a batch of queries.
+MAX_RETRIES = int(os.getenv("PARALLEL_WEB_MAX_RETRIES", "5"))
+
+
+# Default cache lifetime per Chat model; deep research (core) changes slowly.
+DEFAULT_CACHE_TTL = {
+    "base": 24 * 60 * 60,
+    "core": 7 * 24 * 60 * 60,
+}
+
+
+class _ResponseCache:
+    """On-disk cache of successful Chat API results, one JSON file per key.
+
+    Keys hash (model, system_message, user_message), so repeating the same
+    prompt while drafting returns the stored answer instead of re-running a
+    multi-minute research call. Unreadable or expired entries count as misses,
+    and expired files are deleted when read so the directory doesn't grow forever.
+    FORMAT is part of every key, so bumping it when the stored result shape
+    changes orphans older entries instead of serving them.
+    """
+
+    FORMAT = 2
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.expanduser(
+            directory or os.getenv("PARALLEL_WEB_CACHE_DIR", "~/.cache/parallel_web")
+        )
+
+    @staticmethod
+    def key(model: str, system_message: Optional[str], user_message: str) -> str:
+        import hashlib
+
+        payload = json.dumps([_ResponseCache.FORMAT, model, system_message, user_message])
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except OSError:
+            return None
+        except ValueError:
+            entry = {}
+        if entry.get("expires", 0) < time.time():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return None
+        return entry.get("result")
+
+    def set(self, key: str, result: Dict[str, Any], ttl: float) -> None:
+        import tempfile
+
+        entry = {"expires": time.time() + ttl, "result": result}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"[Parallel Chat] Warning: could not write cache: {e}", file=sys.stderr)
+
+
+def _getattr_field(obj, name: str, default=None):
+    """dict.get-style field access for SDK model objects."""
+    return getattr(obj, name, default)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_openai_client(api_key: str, base_url: str):
+    """Return the shared OpenAI client for a key/endpoint pair.
+
+    Every ParallelChat (and so every ParallelSearch/ParallelDeepResearch)
+    reuses one client and its connection pool, keeping TLS connections alive
+    across queries. The client is thread-safe.
+    """
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError(
+            "The 'openai' package is required. Install it with:\n"
+            "  pip install openai"
+        )
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=_make_http_client(),
+        max_retries=MAX_RETRIES,
+    )
+
+
 def _get_extract_client():
-    """Create and return a Parallel SDK client for the Extract API."""
+    """Return the shared Parallel SDK client for the Extract API."""
+    return _get_parallel_client(_get_api_key())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parallel_client(api_key: str):
     try:
         from parallel import Parallel
     except ImportError:
@@ -47,7 +246,22 @@ def _get_extract_client():
             "The 'parallel-web' package is required for extract. Install it with:\n"
             "  pip install parallel-web"
         )
-    return Parallel(api_key=_get_api_key())
+    return Parallel(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_executor():
+    """Return the shared thread pool behind ParallelChat.query_in_executor().
+
+    Its size caps how many blocking queries run at once, keeping concurrent
+    callers from flooding the API.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(
+        max_workers=int(os.getenv("PARALLEL_WEB_WORKERS", "16")),
+        thread_name_prefix="parallel_web",
+    )
 
 
 class ParallelChat:
@@ -63,25 +277,131 @@ class ParallelChat:
 
     CHAT_BASE_URL = "https://api.parallel.ai"
 
-    def __init__(self):
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError(
-                "The 'openai' package is required. Install it with:\n"
-                "  pip install openai"
+    def __init__(self, cache: bool = True, cache_ttl: Optional[float] = None):
+        """
+        Args:
+            cache: Reuse stored responses for identical queries (default True).
+            cache_ttl: Cache lifetime in seconds; defaults per model
+                       (see DEFAULT_CACHE_TTL).
+        """
+        self.cache = _ResponseCache() if cache else None
+        self.cache_ttl = cache_ttl
+        self.client = _get_openai_client(_get_api_key(), self.CHAT_BASE_URL)
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """Lazily create the AsyncOpenAI client used by aquery().
+
+        Unlike the sync client this is per instance: an async connection pool
+        is bound to the event loop it was first used on.
+        """
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+
+            self._async_client = AsyncOpenAI(
+                api_key=_get_api_key(),
+                base_url=self.CHAT_BASE_URL,
+                http_client=_make_http_client(asynchronous=True),
+                max_retries=MAX_RETRIES,
             )
+        return self._async_client
 
-        self.client = OpenAI(
-            api_key=_get_api_key(),
-            base_url=self.CHAT_BASE_URL,
-        )
+    @staticmethod
+    def _build_messages(user_message: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": user_message})
+        return messages
+
+    @staticmethod
+    def _response_content(response) -> str:
+        if response.choices and len(response.choices) > 0:
+            return response.choices[0].message.content or ""
+        return ""
+
+    @staticmethod
+    def _chunk_delta(chunk) -> str:
+        if chunk.choices and len(chunk.choices) > 0:
+            return chunk.choices[0].delta.content or ""
+        return ""
+
+    def _consume_stream(self, chunks, on_delta: Optional[Callable[[str], None]]):
+        """Collect a streamed completion; returns (content, chunk carrying the basis)."""
+        parts = []
+        basis_chunk = None
+        for chunk in chunks:
+            if getattr(chunk, "basis", None):
+                basis_chunk = chunk
+            delta = self._chunk_delta(chunk)
+            if delta:
+                parts.append(delta)
+                if on_delta:
+                    on_delta(delta)
+        return "".join(parts), basis_chunk
+
+    async def _aconsume_stream(self, chunks, on_delta: Optional[Callable[[str], None]]):
+        """Async counterpart of _consume_stream()."""
+        parts = []
+        basis_chunk = None
+        async for chunk in chunks:
+            if getattr(chunk, "basis", None):
+                basis_chunk = chunk
+            delta = self._chunk_delta(chunk)
+            if delta:
+                parts.append(delta)
+                if on_delta:
+                    on_delta(delta)
+        return "".join(parts), basis_chunk
+
+    def _build_result(self, content: str, basis_source, model: str, timestamp_ns: int) -> Dict[str, Any]:
+        sources = self._extract_basis(basis_source)
+
+        return {
+            "success": True,
+            "content": content,
+            "sources": sources,
+            "citation_count": len(sources),
+            "model": model,
+            "timestamp_ns": timestamp_ns,
+        }
+
+    @staticmethod
+    def _build_error(error: Exception, model: str, timestamp_ns: int) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": str(error),
+            "model": model,
+            "timestamp_ns": timestamp_ns,
+        }
+
+    def _cache_lookup(self, model: str, system_message: Optional[str], user_message: str):
+        """Return (key, cached_result); both are None when caching is disabled."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(model, system_message, user_message)
+        cached = self.cache.get(key)
+        if cached is not None:
+            print(f"[Parallel Chat] Cache hit (model={model})", file=sys.stderr)
+            cached["cached"] = True
+        return key, cached
+
+    def _cache_store(self, key: Optional[str], model: str, result: Dict[str, Any]) -> None:
+        if self.cache is None or key is None or not result["success"]:
+            return
+        ttl = self.cache_ttl
+        if ttl is None:
+            ttl = DEFAULT_CACHE_TTL.get(model, DEFAULT_CACHE_TTL["base"])
+        self.cache.set(key, result, ttl)
 
     def query(
         self,
         user_message: str,
         system_message: Optional[str] = None,
         model: str = "base",
+        stream: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Send a query to the Parallel Chat API.
 
@@ -89,16 +409,19 @@ class ParallelChat:
             user_message: The research query or question.
             system_message: Optional system prompt to guide response style.
             model: Chat model to use ('base' or 'core').
+            stream: Stream the completion instead of waiting for the full body.
+            on_delta: Called with each text fragment as it arrives when streaming.
 
         Returns:
             Dict with 'content' (response text), 'sources' (citations), and metadata.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": user_message})
+        timestamp_ns = time.time_ns()
+        key, cached = self._cache_lookup(model, system_message, user_message)
+        if cached is not None:
+            if stream and on_delta:
+                on_delta(cached["content"])
+            return cached
+        messages = self._build_messages(user_message, system_message)
 
         try:
             print(f"[Parallel Chat] Querying model={model}...", file=sys.stderr)
@@ -106,60 +429,86 @@ class ParallelChat:
             response = self.client.chat.completions.create(
                 model=model,
                 messages=messages,
-                stream=False,
+                stream=stream,
             )
+            if stream:
+                content, basis_source = self._consume_stream(response, on_delta)
+            else:
+                content, basis_source = self._response_content(response), response
+            result = self._build_result(content, basis_source, model, timestamp_ns)
+            self._cache_store(key, model, result)
+            return result
 
-            content = ""
-            if response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content or ""
+        except Exception as e:
+            return self._build_error(e, model, timestamp_ns)
 
-            sources = self._extract_basis(response)
+    async def aquery(
+        self,
+        user_message: str,
+        system_message: Optional[str] = None,
+        model: str = "base",
+        stream: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of query(), for running many queries concurrently."""
+        timestamp_ns = time.time_ns()
+        key, cached = self._cache_lookup(model, system_message, user_message)
+        if cached is not None:
+            if stream and on_delta:
+                on_delta(cached["content"])
+            return cached
+        messages = self._build_messages(user_message, system_message)
 
-            return {
-                "success": True,
-                "content": content,
-                "sources": sources,
-                "citation_count": len(sources),
-                "model": model,
-                "timestamp": timestamp,
-            }
+        try:
+            print(f"[Parallel Chat] Querying model={model} (async)...", file=sys.stderr)
+
+            response = await self.async_client.chat.completions.create(
+                model=model,
+                messages=messages,
+                stream=stream,
+            )
+            if stream:
+                content, basis_source = await self._aconsume_stream(response, on_delta)
+            else:
+                content, basis_source = self._response_content(response), response
+            result = self._build_result(content, basis_source, model, timestamp_ns)
+            self._cache_store(key, model, result)
+            return result
 
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "model": model,
-                "timestamp": timestamp,
-            }
+            return self._build_error(e, model, timestamp_ns)
 
-    def _extract_basis(self, response) -> List[Dict[str, str]]:
+    def query_in_executor(self, *args, **kwargs):
+        """Run query() on the shared thread pool and return a concurrent.futures.Future.
+
+        For code that has a sync client but must not block, e.g. a Jupyter
+        cell's event loop: ``await asyncio.wrap_future(chat.query_in_executor(q))``.
+        """
+        return _get_executor().submit(self.query, *args, **kwargs)
+
+    def _extract_basis(self, response) -> List[Dict[str, Any]]:
         """Extract citation sources from the Chat API research basis."""
-        sources = []
         basis = getattr(response, "basis", None)
-        if not basis:
-            return sources
-
-        seen_urls = set()
-        if isinstance(basis, list):
-            for item in basis:
-                citations = (
-                    item.get("citations", []) if isinstance(item, dict)
-                    else getattr(item, "citations", None) or []
-                )
-                for cit in citations:
-                    url = cit.get("url", "") if isinstance(cit, dict) else getattr(cit, "url", "")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        title = cit.get("title", "") if isinstance(cit, dict) else getattr(cit, "title", "")
-                        excerpts = cit.get("excerpts", []) if isinstance(cit, dict) else getattr(cit, "excerpts", [])
-                        sources.append({
-                            "type": "source",
-                            "url": url,
-                            "title": title,
-                            "excerpts": excerpts,
-                        })
-
-        return sources
+        if not basis or not isinstance(basis, list):
+            return []
+
+        # A response uses one shape throughout (raw JSON dicts, or SDK models
+        # in newer clients), so pick the field accessor once, not per field.
+        get = dict.get if isinstance(basis[0], dict) else _getattr_field
+
+        sources_by_url: Dict[str, Dict[str, Any]] = {}
+        for item in basis:
+            for cit in get(item, "citations") or []:
+                url = get(cit, "url")
+                if url and url not in sources_by_url:
+                    sources_by_url[url] = {
+                        "type": "source",
+                        "url": url,
+                        "title": get(cit, "title", ""),
+                        "excerpts": get(cit, "excerpts", []),
+                    }
+
+        return list(sources_by_url.values())
 
 
 class ParallelSearch:
@@ -178,19 +527,22 @@ class ParallelSearch:
         "Cite your sources inline. Be comprehensive but concise."
     )
 
-    def __init__(self):
-        self.chat = ParallelChat()
+    def __init__(self, cache: bool = True, cache_ttl: Optional[float] = None):
+        self.chat = ParallelChat(cache=cache, cache_ttl=cache_ttl)
 
     def search(
         self,
         objective: str,
         model: str = "base",
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Execute a web search via the Chat API.
 
         Args:
             objective: Natural language description of the search goal.
             model: Chat model to use ('base' or 'core', default 'base').
+            on_delta: If given, the response is streamed and each text
+                      fragment is passed to it as it arrives.
 
         Returns:
             Dict with 'response' (synthesized text), 'sources', and metadata.
@@ -199,14 +551,32 @@ class ParallelSearch:
             user_message=objective,
             system_message=self.SYSTEM_PROMPT,
             model=model,
+            stream=on_delta is not None,
+            on_delta=on_delta,
         )
+        return self._to_search_result(objective, result)
 
+    async def asearch(
+        self,
+        objective: str,
+        model: str = "base",
+    ) -> Dict[str, Any]:
+        """Async variant of search(); see gather_searches() for fan-out."""
+        result = await self.chat.aquery(
+            user_message=objective,
+            system_message=self.SYSTEM_PROMPT,
+            model=model,
+        )
+        return self._to_search_result(objective, result)
+
+    @staticmethod
+    def _to_search_result(objective: str, result: Dict[str, Any]) -> Dict[str, Any]:
         if not result["success"]:
             return {
                 "success": False,
                 "objective": objective,
                 "error": result.get("error", "Unknown error"),
-                "timestamp": result["timestamp"],
+                "timestamp_ns": result["timestamp_ns"],
             }
 
         return {
@@ -217,7 +587,7 @@ class ParallelSearch:
             "citation_count": result["citation_count"],
             "model": result["model"],
             "backend": "parallel-chat",
-            "timestamp": result["timestamp"],
+            "timestamp_ns": result["timestamp_ns"],
         }
 
 
@@ -229,6 +599,9 @@ class ParallelExtract:
     For general research, use ParallelSearch or ParallelDeepResearch instead.
     """
 
+    # URLs per Extract API request; larger inputs are split into several requests.
+    MAX_BATCH = 32
+
     def __init__(self):
         self.client = _get_extract_client()
 
@@ -241,6 +614,9 @@ class ParallelExtract:
     ) -> Dict[str, Any]:
         """Extract content from one or more URLs.
 
+        All URLs are sent together (up to MAX_BATCH per request) rather than
+        one request per URL. Duplicate URLs are dropped before the call.
+
         Args:
             urls: List of URLs to extract content from.
             objective: Optional objective to focus extraction.
@@ -250,42 +626,29 @@ class ParallelExtract:
         Returns:
             Dict with 'results' list containing url, title, excerpts/content.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        kwargs = {
-            "urls": urls,
-            "excerpts": excerpts,
-            "full_content": full_content,
-        }
-        if objective:
-            kwargs["objective"] = objective
+        timestamp_ns = time.time_ns()
+        urls = list(dict.fromkeys(urls))
 
         try:
-            response = self.client.beta.extract(**kwargs)
-
             results = []
-            if hasattr(response, "results") and response.results:
-                for r in response.results:
-                    result = {
-                        "url": getattr(r, "url", ""),
-                        "title": getattr(r, "title", ""),
-                        "publish_date": getattr(r, "publish_date", None),
-                        "excerpts": getattr(r, "excerpts", []),
-                        "full_content": getattr(r, "full_content", None),
-                    }
-                    results.append(result)
-
             errors = []
-            if hasattr(response, "errors") and response.errors:
-                errors = [str(e) for e in response.errors]
+            extract_ids = []
+
+            for batch_results, batch_errors, extract_id in self._iter_batches(
+                urls, objective, excerpts, full_content
+            ):
+                results.extend(batch_results)
+                errors.extend(batch_errors)
+                extract_ids.append(extract_id)
 
             return {
                 "success": True,
                 "urls": urls,
                 "results": results,
                 "errors": errors,
-                "timestamp": timestamp,
-                "extract_id": getattr(response, "extract_id", None),
+                "timestamp_ns": timestamp_ns,
+                "extract_id": extract_ids[0] if extract_ids else None,
+                "extract_ids": extract_ids,
             }
 
         except Exception as e:
@@ -293,9 +656,45 @@ class ParallelExtract:
                 "success": False,
                 "urls": urls,
                 "error": str(e),
-                "timestamp": timestamp,
+                "timestamp_ns": timestamp_ns,
             }
 
+    def _iter_batches(
+        self,
+        urls: List[str],
+        objective: Optional[str] = None,
+        excerpts: bool = True,
+        full_content: bool = False,
+    ):
+        """Yield (results, errors, extract_id) for each Extract API request.
+
+        Lets callers handle pages batch by batch (e.g. --ndjson output)
+        instead of holding every extracted page in memory at once.
+        """
+        kwargs = {
+            "excerpts": excerpts,
+            "full_content": full_content,
+        }
+        if objective:
+            kwargs["objective"] = objective
+
+        remaining = iter(urls)
+        while batch := list(islice(remaining, self.MAX_BATCH)):
+            response = self.client.beta.extract(urls=batch, **kwargs)
+
+            results = [
+                {
+                    "url": getattr(r, "url", ""),
+                    "title": getattr(r, "title", ""),
+                    "publish_date": getattr(r, "publish_date", None),
+                    "excerpts": getattr(r, "excerpts", []),
+                    "full_content": getattr(r, "full_content", None),
+                }
+                for r in getattr(response, "results", None) or []
+            ]
+            errors = [str(e) for e in getattr(response, "errors", None) or []]
+            yield results, errors, getattr(response, "extract_id", None)
+
 
 class ParallelDeepResearch:
     """Deep research using the Parallel Chat API (core model).
@@ -316,14 +715,15 @@ class ParallelDeepResearch:
         "Cite all sources inline."
     )
 
-    def __init__(self):
-        self.chat = ParallelChat()
+    def __init__(self, cache: bool = True, cache_ttl: Optional[float] = None):
+        self.chat = ParallelChat(cache=cache, cache_ttl=cache_ttl)
 
     def research(
         self,
         query: str,
         model: str = "core",
         system_prompt: Optional[str] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Run deep research via the Chat API.
 
@@ -331,6 +731,8 @@ class ParallelDeepResearch:
             query: The research question or topic.
             model: Chat model to use ('base' or 'core', default 'core').
             system_prompt: Optional override for the system prompt.
+            on_delta: If given, the report is streamed and each text
+                      fragment is passed to it as it arrives.
 
         Returns:
             Dict with 'response' (markdown report), 'citations', and metadata.
@@ -339,15 +741,34 @@ class ParallelDeepResearch:
             user_message=query,
             system_message=system_prompt or self.SYSTEM_PROMPT,
             model=model,
+            stream=on_delta is not None,
+            on_delta=on_delta,
         )
+        return self._to_research_result(query, model, result)
 
+    async def aresearch(
+        self,
+        query: str,
+        model: str = "core",
+        system_prompt: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of research()."""
+        result = await self.chat.aquery(
+            user_message=query,
+            system_message=system_prompt or self.SYSTEM_PROMPT,
+            model=model,
+        )
+        return self._to_research_result(query, model, result)
+
+    @staticmethod
+    def _to_research_result(query: str, model: str, result: Dict[str, Any]) -> Dict[str, Any]:
         if not result["success"]:
             return {
                 "success": False,
                 "query": query,
                 "error": result.get("error", "Unknown error"),
                 "model": model,
-                "timestamp": result["timestamp"],
+                "timestamp_ns": result["timestamp_ns"],
             }
 
         return {
@@ -360,32 +781,212 @@ class ParallelDeepResearch:
             "citation_count": result["citation_count"],
             "model": model,
             "backend": "parallel-chat",
-            "timestamp": result["timestamp"],
+            "timestamp_ns": result["timestamp_ns"],
         }
 
 
+async def gather_searches(
+    objectives: List[str],
+    model: str = "base",
+    concurrency: int = 8,
+    cache: bool = True,
+    cache_ttl: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Run many searches concurrently, at most `concurrency` in flight at once.
+
+    Results are returned in the same order as `objectives`.
+    """
+    import asyncio
+
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    searcher = ParallelSearch(cache=cache, cache_ttl=cache_ttl)
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+
+    async def run(objective: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await searcher.asearch(objective, model=model)
+
+    return await asyncio.gather(*(run(objective) for objective in objectives))
+
+
+# ---------------------------------------------------------------------------
+# Daemon mode
+# ---------------------------------------------------------------------------
+#
+# Each CLI invocation normally pays for interpreter start-up, the openai SDK
+# import and a fresh TLS handshake. `parallel_web.py daemon` keeps warm clients
+# in one long-running process. With PARALLEL_WEB_USE_DAEMON=1 set, later
+# search/extract/research invocations forward the request to its socket instead
+# of calling the API themselves, falling back to a direct call when no daemon
+# answers. Forwarding is opt-in because the daemon runs with its own API key
+# and cache settings.
+#
+# Protocol: one JSON line per connection, {"cmd": ..., "args": {...}}, answered
+# with one JSON line holding the usual result dict.
+
+# Connecting to a live daemon is near-instant; replies wait on the API call,
+# so allow as long as a deep-research request may take before giving up.
+_DAEMON_CONNECT_TIMEOUT = 5.0
+_DAEMON_REPLY_TIMEOUT = 900.0
+
+def _default_socket_path() -> str:
+    return os.path.expanduser(
+        os.getenv("PARALLEL_WEB_SOCKET", "~/.cache/parallel_web/daemon.sock")
+    )
+
+
+async def _serve_daemon(socket_path: str, cache: bool = True, cache_ttl: Optional[float] = None):
+    """Serve search/research/extract requests on a Unix socket until cancelled."""
+    import asyncio
+    import signal
+
+    searcher = ParallelSearch(cache=cache, cache_ttl=cache_ttl)
+    researcher = ParallelDeepResearch(cache=cache, cache_ttl=cache_ttl)
+    extractor = None
+
+    async def dispatch(cmd: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal extractor
+        if cmd == "search":
+            return await searcher.asearch(**kwargs)
+        if cmd == "research":
+            return await researcher.aresearch(**kwargs)
+        if cmd == "extract":
+            if extractor is None:
+                extractor = ParallelExtract()
+            return await asyncio.to_thread(extractor.extract, **kwargs)
+        if cmd == "ping":
+            return {"success": True}
+        return {"success": False, "error": f"Unknown daemon command: {cmd!r}"}
+
+    async def handle(reader, writer):
+        try:
+            request = json.loads(await reader.readline())
+            result = await dispatch(request.get("cmd"), request.get("args") or {})
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        writer.write(json.dumps(result, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    if _daemon_request(socket_path, "ping", {}) is not None:
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)  # stale socket left by a daemon that didn't shut down cleanly
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+
+    # Requests run with this user's API key, so create the socket owner-only
+    # rather than tightening its mode after bind.
+    old_umask = os.umask(0o177)
+    try:
+        server = await asyncio.start_unix_server(handle, path=socket_path)
+    finally:
+        os.umask(old_umask)
+    # Shut down cleanly (and remove the socket) on `kill` as well as Ctrl-C.
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    print(f"[Parallel Web] Daemon listening on {socket_path}", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _daemon_request(socket_path: str, cmd: str, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send one request to a running daemon.
+
+    Returns None when no daemon is reachable, it times out, or its reply is
+    empty or truncated, so callers fall back to running the request in-process.
+    """
+    if not os.path.exists(socket_path):
+        return None
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_DAEMON_CONNECT_TIMEOUT)
+            sock.connect(socket_path)
+            sock.settimeout(_DAEMON_REPLY_TIMEOUT)
+            sock.sendall(json.dumps({"cmd": cmd, "args": kwargs}).encode("utf-8") + b"\n")
+            chunks = []
+            while data := sock.recv(65536):
+                chunks.append(data)
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+
 # ---------------------------------------------------------------------------
 # CLI Interface
 # ---------------------------------------------------------------------------
 
-def _print_search_results(result: Dict[str, Any], output_file=None):
-    """Print search results (synthesized summary + sources)."""
-    def write(text):
-        if output_file:
-            output_file.write(text + "\n")
-        else:
-            print(text)
+def _json_dumpb(obj: Any, indent: bool = True) -> bytes:
+    """Serialize CLI results as UTF-8 JSON, using orjson when installed.
+
+    indent=False gives the compact single-line form used for NDJSON records.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=str)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _write_json(obj: Any, output_file=None):
+    """Write `obj` as JSON to a binary output file, or to stdout."""
+    data = _json_dumpb(obj) + b"\n"
+    if output_file is not None:
+        output_file.write(data)
+    else:
+        sys.stdout.write(data.decode("utf-8"))
+
+
+def _write_ndjson(records: List[Dict[str, Any]], output_file=None):
+    """Append records as newline-delimited JSON, flushing so readers see them promptly."""
+    data = b"".join(_json_dumpb(record, indent=False) + b"\n" for record in records)
+    stream = output_file if output_file is not None else sys.stdout
+    stream.write(data if output_file is not None else data.decode("utf-8"))
+    stream.flush()
+
+
+def _format_timestamp(result: Dict[str, Any]) -> str:
+    """Render a result's timestamp_ns for display."""
+    from datetime import datetime
+
+    return datetime.fromtimestamp(result["timestamp_ns"] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _write_lines(lines: List[str], output_file=None):
+    """Emit buffered output lines with a single write."""
+    (output_file or sys.stdout).write("\n".join(lines) + "\n")
+
+
+def _print_search_results(result: Dict[str, Any], output_file=None, include_response: bool = True):
+    """Print search results (synthesized summary + sources).
+
+    include_response=False skips the summary body, e.g. when it was already
+    streamed to the terminal.
+    """
+    lines: List[str] = []
+    write = lines.append
 
     if not result["success"]:
         write(f"Error: {result.get('error', 'Unknown error')}")
+        _write_lines(lines, output_file)
         return
 
     write(f"\n{'='*80}")
     write(f"Search: {result['objective']}")
-    write(f"Model: {result['model']} | Time: {result['timestamp']}")
+    write(f"Model: {result['model']} | Time: {_format_timestamp(result)}")
     write(f"{'='*80}\n")
 
-    write(result.get("response", "No response received."))
+    if include_response:
+        write(result.get("response", "No response received."))
 
     sources = result.get("sources", [])
     if sources:
@@ -397,22 +998,22 @@ def _print_search_results(result: Dict[str, Any], output_file=None):
             if url:
                 write(f"      {url}")
 
+    _write_lines(lines, output_file)
+
 
 def _print_extract_results(result: Dict[str, Any], output_file=None):
     """Pretty-print extract results."""
-    def write(text):
-        if output_file:
-            output_file.write(text + "\n")
-        else:
-            print(text)
+    lines: List[str] = []
+    write = lines.append
 
     if not result["success"]:
         write(f"Error: {result.get('error', 'Unknown error')}")
+        _write_lines(lines, output_file)
         return
 
     write(f"\n{'='*80}")
     write(f"Extracted from: {', '.join(result['urls'])}")
-    write(f"Time: {result['timestamp']}")
+    write(f"Time: {_format_timestamp(result)}")
     write(f"{'='*80}")
 
     for i, r in enumerate(result["results"]):
@@ -423,22 +1024,26 @@ def _print_extract_results(result: Dict[str, Any], output_file=None):
         elif r.get("excerpts"):
             for j, excerpt in enumerate(r["excerpts"]):
                 write(f"\nExcerpt {j+1}:")
-                write(excerpt[:2000] if len(excerpt) > 2000 else excerpt)
+                write(excerpt[:2000])
 
     if result.get("errors"):
         write(f"\nErrors: {result['errors']}")
 
+    _write_lines(lines, output_file)
 
-def _print_research_results(result: Dict[str, Any], output_file=None):
-    """Print deep research results (report + sources)."""
-    def write(text):
-        if output_file:
-            output_file.write(text + "\n")
-        else:
-            print(text)
+
+def _print_research_results(result: Dict[str, Any], output_file=None, include_response: bool = True):
+    """Print deep research results (report + sources).
+
+    include_response=False skips the report body, e.g. when it was already
+    streamed to the terminal.
+    """
+    lines: List[str] = []
+    write = lines.append
 
     if not result["success"]:
         write(f"Error: {result.get('error', 'Unknown error')}")
+        _write_lines(lines, output_file)
         return
 
     write(f"\n{'='*80}")
@@ -446,37 +1051,81 @@ def _print_research_results(result: Dict[str, Any], output_file=None):
     if len(result['query']) > 100:
         query_display += "..."
     write(f"Research: {query_display}")
-    write(f"Model: {result['model']} | Citations: {result.get('citation_count', 0)} | Time: {result['timestamp']}")
+    write(
+        f"Model: {result['model']} | Citations: {result.get('citation_count', 0)} "
+        f"| Time: {_format_timestamp(result)}"
+    )
     write(f"{'='*80}\n")
 
-    write(result.get("response", result.get("output", "No output received.")))
+    if include_response:
+        write(result.get("response", result.get("output", "No output received.")))
 
     citations = result.get("citations", result.get("sources", []))
     if citations:
         write(f"\n\n{'='*40} SOURCES {'='*40}")
-        seen_urls = set()
+        titles_by_url: Dict[str, str] = {}
         for cit in citations:
             url = cit.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                title = cit.get("title", "Untitled")
-                write(f"  [{len(seen_urls)}] {title}")
-                write(f"      {url}")
+            if url:
+                titles_by_url.setdefault(url, cit.get("title", "Untitled"))
+        for i, (url, title) in enumerate(titles_by_url.items()):
+            write(f"  [{i+1}] {title}")
+            write(f"      {url}")
 
+    _write_lines(lines, output_file)
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Parallel Web Systems API Client - Search, Extract, and Deep Research",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+
+def _stream_printer(stream):
+    """Return an on_delta callback that echoes text fragments to `stream` as they arrive."""
+    def write(delta: str):
+        stream.write(delta)
+        stream.flush()
+    return write
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _add_cache_arguments(subparser):
+    """Attach the response-cache flags shared by the Chat API subcommands."""
+    subparser.add_argument("--no-cache", action="store_true",
+                           help="Always query the API; do not read or write the response cache")
+    subparser.add_argument("--cache-ttl", type=float, default=None,
+                           help="Cache lifetime in seconds (default: 24h for base, 7d for core)")
+
+
+_EPILOG = """
 Examples:
   python parallel_web.py search "latest advances in quantum computing"
   python parallel_web.py search "climate policy 2025" --model core
+  printf "topic one\\ntopic two\\n" | python parallel_web.py search-batch --concurrency 4
   python parallel_web.py extract "https://example.com" --objective "key findings"
+  python parallel_web.py extract URL1 URL2 URL3 --full-content --ndjson -o pages.ndjson
   python parallel_web.py research "comprehensive analysis of EV battery market"
   python parallel_web.py research "compare mRNA vs protein subunit vaccines" --model base
   python parallel_web.py research "AI regulation landscape 2025" -o report.md
-        """,
+  python parallel_web.py research "AI regulation landscape 2025" --no-cache
+  python parallel_web.py research "AI regulation landscape 2025" --stream
+  python parallel_web.py daemon &   # keep warm clients in the background
+  PARALLEL_WEB_USE_DAEMON=1 python parallel_web.py search "CRISPR off-target effects"
+"""
+
+# Chat models accepted by --model.
+_CHAT_MODELS = ("base", "core")
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; repeated main() calls in one process reuse it."""
+    parser = argparse.ArgumentParser(
+        description="Parallel Web Systems API Client - Search, Extract, and Deep Research",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     subparsers = parser.add_subparsers(dest="command", help="API command")
@@ -484,10 +1133,26 @@ Examples:
     # --- search subcommand ---
     search_parser = subparsers.add_parser("search", help="Web search via Chat API (synthesized results)")
     search_parser.add_argument("objective", help="Natural language search objective")
-    search_parser.add_argument("--model", default="base", choices=["base", "core"],
+    search_parser.add_argument("--model", default="base", choices=_CHAT_MODELS,
                                help="Chat model to use (default: base)")
     search_parser.add_argument("-o", "--output", help="Write output to file")
     search_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    search_parser.add_argument("--stream", action="store_true",
+                               help="Print the response as it is generated")
+    _add_cache_arguments(search_parser)
+
+    # --- search-batch subcommand ---
+    batch_parser = subparsers.add_parser(
+        "search-batch",
+        help="Run many searches concurrently (newline-separated objectives on stdin)",
+    )
+    batch_parser.add_argument("--model", default="base", choices=_CHAT_MODELS,
+                              help="Chat model to use (default: base)")
+    batch_parser.add_argument("--concurrency", type=_positive_int, default=8,
+                              help="Maximum searches in flight at once (default: 8)")
+    batch_parser.add_argument("-o", "--output", help="Write output to file")
+    batch_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    _add_cache_arguments(batch_parser)
 
     # --- extract subcommand ---
     extract_parser = subparsers.add_parser("extract", help="Extract content from URLs (verification only)")
@@ -495,63 +1160,163 @@ Examples:
     extract_parser.add_argument("--objective", help="Objective to focus extraction")
     extract_parser.add_argument("--full-content", action="store_true", help="Return full page content")
     extract_parser.add_argument("-o", "--output", help="Write output to file")
-    extract_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    extract_format = extract_parser.add_mutually_exclusive_group()
+    extract_format.add_argument("--json", action="store_true", help="Output as JSON")
+    extract_format.add_argument("--ndjson", action="store_true",
+                                help="Output one JSON line per page as each batch arrives "
+                                     "(errors as {\"error\": ...} lines)")
 
     # --- research subcommand ---
     research_parser = subparsers.add_parser("research", help="Deep research via Chat API (comprehensive report)")
     research_parser.add_argument("query", help="Research question or topic")
-    research_parser.add_argument("--model", default="core", choices=["base", "core"],
+    research_parser.add_argument("--model", default="core", choices=_CHAT_MODELS,
                                  help="Chat model to use (default: core)")
     research_parser.add_argument("-o", "--output", help="Write output to file")
     research_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    research_parser.add_argument("--stream", action="store_true",
+                                 help="Print the report as it is generated")
+    _add_cache_arguments(research_parser)
+
+    # --- daemon subcommand ---
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Keep warm API clients in a background process for faster repeated calls"
+    )
+    daemon_parser.add_argument("--socket", default=_default_socket_path(),
+                               help="Unix socket path (default: $PARALLEL_WEB_SOCKET or "
+                                    "~/.cache/parallel_web/daemon.sock)")
+    _add_cache_arguments(daemon_parser)
+
+    return parser
+
 
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return 1
 
+    if args.command == "daemon":
+        import asyncio
+        import socket
+
+        if not hasattr(socket, "AF_UNIX"):
+            print("Error: daemon mode requires Unix domain sockets", file=sys.stderr)
+            return 1
+        try:
+            asyncio.run(_serve_daemon(args.socket, cache=not args.no_cache, cache_ttl=args.cache_ttl))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    # Forward to a running daemon only when asked to, and never when this call
+    # needs per-invocation options (streaming, cache overrides) that the daemon
+    # process doesn't share.
+    use_daemon = os.getenv("PARALLEL_WEB_USE_DAEMON") == "1" and not (
+        getattr(args, "stream", False)
+        or getattr(args, "no_cache", False)
+        or getattr(args, "cache_ttl", None) is not None
+        or getattr(args, "ndjson", False)
+    )
+    socket_path = _default_socket_path()
+
     output_file = None
     if hasattr(args, "output") and args.output:
-        output_file = open(args.output, "w", encoding="utf-8")
+        # JSON is already UTF-8 bytes; write it without a decode/encode round trip.
+        if args.json or getattr(args, "ndjson", False):
+            output_file = open(args.output, "wb")
+        else:
+            output_file = open(args.output, "w", encoding="utf-8")
+
+    # Streamed text goes to stdout unless stdout is reserved for the JSON result.
+    stream_target = None
+    if getattr(args, "stream", False):
+        stream_target = sys.stderr if (args.json and not output_file) else sys.stdout
+    on_delta = _stream_printer(stream_target) if stream_target else None
+    # Don't print the body twice when it was just streamed to the terminal.
+    include_response = not (stream_target is sys.stdout and output_file is None)
 
     try:
         if args.command == "search":
-            searcher = ParallelSearch()
-            result = searcher.search(
-                objective=args.objective,
-                model=args.model,
+            result = use_daemon and _daemon_request(
+                socket_path, "search", {"objective": args.objective, "model": args.model}
             )
+            if not result:
+                searcher = ParallelSearch(cache=not args.no_cache, cache_ttl=args.cache_ttl)
+                result = searcher.search(
+                    objective=args.objective,
+                    model=args.model,
+                    on_delta=on_delta,
+                )
             if args.json:
-                text = json.dumps(result, indent=2, ensure_ascii=False, default=str)
-                (output_file or sys.stdout).write(text + "\n")
+                _write_json(result, output_file)
             else:
-                _print_search_results(result, output_file)
+                _print_search_results(result, output_file, include_response=include_response)
 
-        elif args.command == "extract":
+        elif args.command == "search-batch":
+            objectives = [line.strip() for line in sys.stdin if line.strip()]
+            if not objectives:
+                print("Error: no search objectives provided on stdin", file=sys.stderr)
+                return 1
+            import asyncio
+
+            results = asyncio.run(gather_searches(
+                objectives,
+                model=args.model,
+                concurrency=args.concurrency,
+                cache=not args.no_cache,
+                cache_ttl=args.cache_ttl,
+            ))
+            if args.json:
+                _write_json(results, output_file)
+            else:
+                for result in results:
+                    _print_search_results(result, output_file)
+
+        elif args.command == "extract" and args.ndjson:
             extractor = ParallelExtract()
-            result = extractor.extract(
-                urls=args.urls,
-                objective=args.objective,
-                full_content=args.full_content,
-            )
+            for results, errors, _ in extractor._iter_batches(
+                list(dict.fromkeys(args.urls)), args.objective, full_content=args.full_content
+            ):
+                _write_ndjson(results + [{"error": error} for error in errors], output_file)
+
+        elif args.command == "extract":
+            result = use_daemon and _daemon_request(socket_path, "extract", {
+                "urls": args.urls,
+                "objective": args.objective,
+                "full_content": args.full_content,
+            })
+            if not result:
+                extractor = ParallelExtract()
+                result = extractor.extract(
+                    urls=args.urls,
+                    objective=args.objective,
+                    full_content=args.full_content,
+                )
             if args.json:
-                text = json.dumps(result, indent=2, ensure_ascii=False, default=str)
-                (output_file or sys.stdout).write(text + "\n")
+                _write_json(result, output_file)
             else:
                 _print_extract_results(result, output_file)
 
         elif args.command == "research":
-            researcher = ParallelDeepResearch()
-            result = researcher.research(
-                query=args.query,
-                model=args.model,
+            result = use_daemon and _daemon_request(
+                socket_path, "research", {"query": args.query, "model": args.model}
             )
+            if not result:
+                researcher = ParallelDeepResearch(cache=not args.no_cache, cache_ttl=args.cache_ttl)
+                result = researcher.research(
+                    query=args.query,
+                    model=args.model,
+                    on_delta=on_delta,
+                )
             if args.json:
-                text = json.dumps(result, indent=2, ensure_ascii=False, default=str)
-                (output_file or sys.stdout).write(text + "\n")
+                _write_json(result, output_file)
             else:
-                _print_research_results(result, output_file)
+                _print_research_results(result, output_file, include_response=include_response)
 
         return 0
 
@@ -13,6 +13,11 @@ import asyncio
 import json
 from scientific_writer import generate_paper
 
+try:
+    import msgspec
+except ImportError:  # optional: faster JSON encoding for large results
+    msgspec = None
+
 
 async def simple_example():
     """Simple example: Generate a paper with live text streaming."""
@@ -101,8 +106,12 @@ async def advanced_example():
     if result_data:
         # Save the complete result to JSON for later reference
         output_file = "paper_result.json"
-        with open(output_file, "w") as f:
-            json.dump(result_data, f, indent=2)
+        if msgspec is not None:
+            with open(output_file, "wb") as f:
+                f.write(msgspec.json.format(msgspec.json.encode(result_data), indent=2))
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(result_data, f, indent=2)
 
         print(f"\n✓ Result saved to: {output_file}")
         print(f"✓ Paper directory: {result_data['paper_directory']}")
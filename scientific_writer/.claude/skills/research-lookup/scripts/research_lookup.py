@@ -8,17 +8,28 @@ Routes research queries to the best backend:
 
 Environment variables:
   PARALLEL_API_KEY    - Required for Parallel Chat API (deep research backend)
+  RESEARCH_LOOKUP_CACHE_DIR - Where lookup results are cached
+                        (default: ~/.cache/research_lookup)
 """
 
 import os
 import sys
 import json
 import re
+import functools
 import subprocess
 import time
-import requests
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import orjson  # optional: faster JSON parsing, cache I/O and --json output
+except ImportError:
+    orjson = None
+
+try:
+    import re2  # optional (pip install google-re2): linear-time citation matching
+except ImportError:
+    re2 = None
 
 
 ACADEMIC_DOMAINS = (
@@ -43,11 +54,21 @@ ACADEMIC_KEYWORDS = [
     "highly cited", "most cited",
 ]
 
+
+def _keywords_re(keywords: List[str]) -> "re.Pattern[str]":
+    """Fold keywords into one case-insensitive pattern: one scan per query."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+_ACADEMIC_KEYWORDS_RE = _keywords_re(ACADEMIC_KEYWORDS)
+
 DEEP_RESEARCH_KEYWORDS = [
     "deep research", "exhaustive", "comprehensive review",
     "multi-source", "thorough analysis",
 ]
 
+_DEEP_RESEARCH_KEYWORDS_RE = _keywords_re(DEEP_RESEARCH_KEYWORDS)
+
 PARALLEL_SYSTEM_PROMPT = (
     "You are a deep research analyst. Provide a comprehensive, well-cited "
     "research report on the user's topic. Include:\n"
@@ -62,6 +83,158 @@ PARALLEL_SYSTEM_PROMPT = (
 
 CHAT_BASE_URL = "https://api.parallel.ai"
 
+# Seconds a single parallel-cli search may run before it is killed.
+PARALLEL_CLI_TIMEOUT = 60
+
+# Default lifetime of cached lookup results, in seconds.
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+# Queries asking for the newest results go stale fast; their cache entries
+# live at most this long whatever --cache-ttl says.
+RECENT_CACHE_TTL = 60 * 60
+
+RECENCY_KEYWORDS = [
+    "latest", "recent", "current", "today", "this week", "this month",
+    "this year", "breaking", "up-to-date", "up to date", "new developments",
+]
+
+_RECENCY_KEYWORDS_RE = _keywords_re(RECENCY_KEYWORDS)
+
+# Fallback citation extraction from response text (see _extract_citations_from_text).
+# Deep-research reports run to many KB, so use RE2's DFA matcher when available;
+# both patterns are plain classes and alternations that RE2 accepts. Neither
+# match can end in sentence punctuation, so results need no trimming.
+_citation_re = re2 if re2 is not None else re
+
+_DOI_RE = _citation_re.compile(
+    r'(?i)(?:doi[:\s]*|https?://(?:dx\.)?doi\.org/)'
+    r'(10\.[0-9]{4,}/[^\s\)\]\,\[\<\>]*[^\s\)\]\,\[\<\>\.\;\:])',
+)
+_ACADEMIC_URL_RE = _citation_re.compile(
+    r'(?i)https?://[^\s\)\]\,\<\>\"\']+(?:arxiv\.org|pubmed|ncbi\.nlm\.nih\.gov|'
+    r'nature\.com|science\.org|wiley\.com|springer\.com|ieee\.org|acm\.org)'
+    r'(?:[^\s\)\]\,\<\>\"\']*[^\s\)\]\,\<\>\"\'\.])?'
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse raw UTF-8 JSON bytes, with orjson when installed (no str decode step)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+
+class _ResponseCache:
+    """On-disk cache of successful lookup results, one JSON file per key.
+
+    Research queries repeat a lot while drafting; a hit returns the stored
+    result instead of re-running the search or a paid deep-research call.
+    Unreadable or expired entries count as misses, and expired files are
+    deleted when read so the directory doesn't grow forever.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = os.path.expanduser(
+            directory or os.getenv("RESEARCH_LOOKUP_CACHE_DIR", "~/.cache/research_lookup")
+        )
+
+    @staticmethod
+    def key(backend: str, query: str) -> str:
+        import hashlib
+
+        # The deep-research prompt is part of the key so editing it invalidates old answers.
+        prompt = PARALLEL_SYSTEM_PROMPT if backend == "parallel-chat" else ACADEMIC_DOMAINS
+        payload = json.dumps([backend, query, prompt])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = _json_loads(f.read())
+        except OSError:
+            return None
+        except ValueError:
+            entry = {}
+        if entry.get("expires", 0) < time.time():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return None
+        return entry.get("result")
+
+    def set(self, key: str, result: Dict[str, Any], ttl: float) -> None:
+        import tempfile
+
+        entry = {"expires": time.time() + ttl, "result": result}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumpb(entry))
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"[Research] Warning: could not write cache: {e}", file=sys.stderr)
+
+
+def _as_mapping(obj, fields) -> Dict[str, Any]:
+    """View a basis entry or citation (plain dict or SDK object) as a dict of `fields`."""
+    if isinstance(obj, dict):
+        return obj
+    return {field: getattr(obj, field, None) for field in fields}
+
+
+def _make_http_client(asynchronous: bool = False):
+    """Build the httpx client behind the Chat API clients.
+
+    Deep-research calls run for minutes, so reads get a generous timeout
+    while connects fail fast. HTTP/2 is used when the optional 'h2' package
+    is installed (pip install "httpx[http2]"), letting batch_lookup's
+    concurrent queries share one connection.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    client_class = httpx.AsyncClient if asynchronous else httpx.Client
+    return client_class(
+        http2=http2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=8),
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chat_client(api_key: Optional[str]):
+    """Lazy-load one OpenAI client per API key for the whole process.
+
+    Every ResearchLookup (and every query in batch_lookup) reuses its
+    connection pool, so repeat calls skip the TCP and TLS handshakes.
+    """
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError(
+            "The 'openai' package is required for Parallel Chat API.\n"
+            "Install it with: pip install openai"
+        )
+    return OpenAI(api_key=api_key, base_url=CHAT_BASE_URL, http_client=_make_http_client())
+
 
 class ResearchLookup:
     """Research information lookup with intelligent backend routing.
@@ -70,14 +243,25 @@ class ResearchLookup:
     Parallel Chat API (deep research only).
     """
 
-    def __init__(self, force_backend: Optional[str] = None):
+    def __init__(
+        self,
+        force_backend: Optional[str] = None,
+        cache: bool = True,
+        cache_ttl: Optional[float] = None,
+    ):
         """Initialize the research lookup tool.
 
         Args:
             force_backend: Force a specific backend ('parallel-cli' or 'parallel-chat').
                           If None, backend is auto-selected based on query content.
+            cache: Reuse stored results for repeated queries (default True).
+            cache_ttl: Cache lifetime in seconds (default: DEFAULT_CACHE_TTL, 24h).
+                       Queries asking for recent results are capped at RECENT_CACHE_TTL.
         """
         self.force_backend = force_backend
+        self.cache = _ResponseCache() if cache else None
+        self.cache_ttl = DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+        self._async_chat_client = None
         self.parallel_chat_available = bool(os.getenv("PARALLEL_API_KEY"))
         self.parallel_cli_available = self._check_parallel_cli()
 
@@ -107,8 +291,7 @@ class ResearchLookup:
             if self.force_backend == "parallel-cli" and self.parallel_cli_available:
                 return "parallel-cli"
 
-        query_lower = query.lower()
-        is_deep = any(kw in query_lower for kw in DEEP_RESEARCH_KEYWORDS)
+        is_deep = _DEEP_RESEARCH_KEYWORDS_RE.search(query) is not None
 
         if is_deep and self.parallel_chat_available:
             return "parallel-chat"
@@ -127,60 +310,91 @@ class ResearchLookup:
 
     def _parallel_cli_lookup(self, query: str) -> Dict[str, Any]:
         """Run research via parallel-cli search (primary backend)."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        query_lower = query.lower()
-        is_academic = any(kw in query_lower for kw in ACADEMIC_KEYWORDS)
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        is_academic = _ACADEMIC_KEYWORDS_RE.search(query) is not None
 
         try:
-            all_results = []
+            academic_results: List[Dict[str, Any]] = []
 
             if is_academic:
                 # Two-search pattern for academic queries
                 print("[Research] parallel-cli search (academic domains)...", file=sys.stderr)
-                academic_result = self._run_parallel_cli_search(
+                academic_results = self._run_parallel_cli_search(
                     query,
                     include_domains=ACADEMIC_DOMAINS,
                     max_results=10,
                 )
-                all_results.extend(academic_result)
 
             # General search (always run for non-academic; supplemental for academic)
             print("[Research] parallel-cli search (general)...", file=sys.stderr)
-            general_result = self._run_parallel_cli_search(query, max_results=10)
-            # Deduplicate by URL
-            existing_urls = {r.get("url") for r in all_results}
-            for r in general_result:
-                if r.get("url") not in existing_urls:
-                    all_results.append(r)
-                    existing_urls.add(r.get("url"))
-
-            response_text = self._format_cli_results(query, all_results)
-            sources = [
-                {"type": "source", "title": r.get("title", ""), "url": r.get("url", ""),
-                 "date": r.get("date", ""), "snippet": r.get("snippet", "")}
-                for r in all_results
-            ]
-
-            return {
-                "success": True,
-                "query": query,
-                "response": response_text,
-                "citations": sources,
-                "sources": sources,
-                "timestamp": timestamp,
-                "backend": "parallel-cli",
-                "model": "parallel-cli/search",
-            }
+            general_results = self._run_parallel_cli_search(query, max_results=10)
+
+            return self._cli_result(query, academic_results, general_results, timestamp)
+
+        except Exception as e:
+            return self._error_result(query, e, timestamp, "parallel-cli", "parallel-cli/search")
+
+    async def _parallel_cli_lookup_async(self, query: str) -> Dict[str, Any]:
+        """Async variant of _parallel_cli_lookup(); both searches run at once."""
+        import asyncio
+
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        is_academic = _ACADEMIC_KEYWORDS_RE.search(query) is not None
+
+        try:
+            general = self._run_parallel_cli_search_async(query, max_results=10)
+            if is_academic:
+                print("[Research] parallel-cli search (academic domains + general)...", file=sys.stderr)
+                academic_results, general_results = await asyncio.gather(
+                    self._run_parallel_cli_search_async(
+                        query,
+                        include_domains=ACADEMIC_DOMAINS,
+                        max_results=10,
+                    ),
+                    general,
+                )
+            else:
+                print("[Research] parallel-cli search (general)...", file=sys.stderr)
+                academic_results, general_results = [], await general
+
+            return self._cli_result(query, academic_results, general_results, timestamp)
 
         except Exception as e:
-            return {
-                "success": False,
-                "query": query,
-                "error": str(e),
-                "timestamp": timestamp,
-                "backend": "parallel-cli",
-                "model": "parallel-cli/search",
-            }
+            return self._error_result(query, e, timestamp, "parallel-cli", "parallel-cli/search")
+
+    def _cli_result(
+        self,
+        query: str,
+        academic_results: List[Dict[str, Any]],
+        general_results: List[Dict[str, Any]],
+        timestamp: str,
+    ) -> Dict[str, Any]:
+        """Merge academic and general search hits into a lookup result."""
+        all_results = list(academic_results)
+        # Deduplicate by URL
+        existing_urls = {r.get("url") for r in all_results}
+        for r in general_results:
+            if r.get("url") not in existing_urls:
+                all_results.append(r)
+                existing_urls.add(r.get("url"))
+
+        response_text = self._format_cli_results(query, all_results)
+        sources = [
+            {"type": "source", "title": r.get("title", ""), "url": r.get("url", ""),
+             "date": r.get("date", ""), "snippet": r.get("snippet", "")}
+            for r in all_results
+        ]
+
+        return {
+            "success": True,
+            "query": query,
+            "response": response_text,
+            "citations": sources,
+            "sources": sources,
+            "timestamp": timestamp,
+            "backend": "parallel-cli",
+            "model": "parallel-cli/search",
+        }
 
     def _run_parallel_cli_search(
         self,
@@ -190,6 +404,55 @@ class ResearchLookup:
         after_date: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Execute a parallel-cli search and return parsed results."""
+        cmd, out_path = self._parallel_cli_command(query, include_domains, max_results, after_date)
+
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, timeout=PARALLEL_CLI_TIMEOUT)
+        except Exception:
+            os.unlink(out_path)
+            raise
+        return self._read_parallel_cli_output(out_path)
+
+    async def _run_parallel_cli_search_async(
+        self,
+        query: str,
+        include_domains: Optional[str] = None,
+        max_results: int = 10,
+        after_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of _run_parallel_cli_search(); doesn't block the event loop."""
+        import asyncio
+
+        cmd, out_path = self._parallel_cli_command(query, include_domains, max_results, after_date)
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=PARALLEL_CLI_TIMEOUT)
+            except BaseException as e:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()  # reap the child so it isn't left a zombie
+                if isinstance(e, asyncio.TimeoutError):
+                    raise RuntimeError(
+                        f"parallel-cli search timed out after {PARALLEL_CLI_TIMEOUT}s"
+                    ) from None
+                raise
+        except BaseException:
+            os.unlink(out_path)
+            raise
+        return self._read_parallel_cli_output(out_path)
+
+    def _parallel_cli_command(
+        self,
+        query: str,
+        include_domains: Optional[str],
+        max_results: int,
+        after_date: Optional[str],
+    ):
+        """Build a parallel-cli search command; returns (cmd, JSON output path)."""
         import tempfile
 
         with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
@@ -206,17 +469,19 @@ class ResearchLookup:
             cmd += ["--include-domains", include_domains]
         if after_date:
             cmd += ["--after-date", after_date]
+        return cmd, out_path
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
+    @staticmethod
+    def _read_parallel_cli_output(out_path: str) -> List[Dict[str, Any]]:
+        """Parse and remove a parallel-cli JSON output file."""
         try:
-            with open(out_path) as f:
-                data = json.load(f)
-            os.unlink(out_path)
+            with open(out_path, "rb") as f:
+                data = _json_loads(f.read())
             return data if isinstance(data, list) else data.get("results", [])
         except Exception:
-            os.unlink(out_path)
             return []
+        finally:
+            os.unlink(out_path)
 
     def _format_cli_results(self, query: str, results: List[Dict[str, Any]]) -> str:
         """Format parallel-cli results into a readable response."""
@@ -244,24 +509,47 @@ class ResearchLookup:
     # ------------------------------------------------------------------
 
     def _get_chat_client(self):
-        """Lazy-load and cache the OpenAI client for Parallel Chat API."""
-        if not hasattr(self, "_chat_client"):
+        """Return the shared OpenAI client for the Parallel Chat API."""
+        return _get_chat_client(os.getenv("PARALLEL_API_KEY"))
+
+    def _get_async_chat_client(self):
+        """Lazily create the AsyncOpenAI client used by lookup_async().
+
+        Unlike the sync client this is per instance: an async connection pool
+        is bound to the event loop it was first used on.
+        """
+        if self._async_chat_client is None:
             try:
-                from openai import OpenAI
+                from openai import AsyncOpenAI
             except ImportError:
                 raise ImportError(
                     "The 'openai' package is required for Parallel Chat API.\n"
                     "Install it with: pip install openai"
                 )
-            self._chat_client = OpenAI(
+            self._async_chat_client = AsyncOpenAI(
                 api_key=os.getenv("PARALLEL_API_KEY"),
                 base_url=CHAT_BASE_URL,
+                http_client=_make_http_client(asynchronous=True),
             )
-        return self._chat_client
+        return self._async_chat_client
 
-    def _parallel_chat_lookup(self, query: str) -> Dict[str, Any]:
-        """Run deep research via the Parallel Chat API (core model)."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    @staticmethod
+    def _chat_messages(query: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": PARALLEL_SYSTEM_PROMPT},
+            {"role": "user", "content": query},
+        ]
+
+    def _parallel_chat_lookup(
+        self, query: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Run deep research via the Parallel Chat API (core model).
+
+        When `on_delta` is given the report is streamed and it receives each
+        text fragment as it arrives; otherwise one complete response is
+        fetched, which always carries the research basis.
+        """
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         model = "core"
 
         try:
@@ -270,141 +558,269 @@ class ResearchLookup:
 
             response = client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": PARALLEL_SYSTEM_PROMPT},
-                    {"role": "user", "content": query},
-                ],
-                stream=False,
+                messages=self._chat_messages(query),
+                stream=on_delta is not None,
             )
+            if on_delta is None:
+                content = (response.choices[0].message.content or "") if response.choices else ""
+                return self._chat_result(query, model, content, response, timestamp)
+
+            parts = []
+            basis_chunk = None
+            for chunk in response:
+                if getattr(chunk, "basis", None):
+                    basis_chunk = chunk
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+
+            return self._chat_result(query, model, "".join(parts), basis_chunk, timestamp)
 
-            content = ""
-            if response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content or ""
+        except Exception as e:
+            return self._error_result(query, e, timestamp, "parallel-chat", f"parallel-chat/{model}")
 
-            api_citations = self._extract_basis_citations(response)
-            text_citations = self._extract_citations_from_text(content)
+    async def _parallel_chat_lookup_async(
+        self, query: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Async variant of _parallel_chat_lookup()."""
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        model = "core"
 
-            return {
-                "success": True,
-                "query": query,
-                "response": content,
-                "citations": api_citations + text_citations,
-                "sources": api_citations,
-                "timestamp": timestamp,
-                "backend": "parallel-chat",
-                "model": f"parallel-chat/{model}",
-            }
+        try:
+            client = self._get_async_chat_client()
+            print(f"[Research] Parallel Chat API (model={model}, deep research, async)...", file=sys.stderr)
+
+            response = await client.chat.completions.create(
+                model=model,
+                messages=self._chat_messages(query),
+                stream=on_delta is not None,
+            )
+            if on_delta is None:
+                content = (response.choices[0].message.content or "") if response.choices else ""
+                return self._chat_result(query, model, content, response, timestamp)
+
+            parts = []
+            basis_chunk = None
+            async for chunk in response:
+                if getattr(chunk, "basis", None):
+                    basis_chunk = chunk
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    on_delta(delta)
+
+            return self._chat_result(query, model, "".join(parts), basis_chunk, timestamp)
 
         except Exception as e:
-            return {
-                "success": False,
-                "query": query,
-                "error": str(e),
-                "timestamp": timestamp,
-                "backend": "parallel-chat",
-                "model": f"parallel-chat/{model}",
-            }
+            return self._error_result(query, e, timestamp, "parallel-chat", f"parallel-chat/{model}")
+
+    def _chat_result(
+        self, query: str, model: str, content: str, basis_source, timestamp: str
+    ) -> Dict[str, Any]:
+        api_citations = self._extract_basis_citations(basis_source)
+        text_citations = self._extract_citations_from_text(content)
+
+        return {
+            "success": True,
+            "query": query,
+            "response": content,
+            "citations": api_citations + text_citations,
+            "sources": api_citations,
+            "timestamp": timestamp,
+            "backend": "parallel-chat",
+            "model": f"parallel-chat/{model}",
+        }
 
     def _extract_basis_citations(self, response) -> List[Dict[str, str]]:
         """Extract citation sources from the Chat API research basis."""
-        citations = []
         basis = getattr(response, "basis", None)
-        if not basis:
-            return citations
-
-        seen_urls = set()
-        if isinstance(basis, list):
-            for item in basis:
-                cits = (
-                    item.get("citations", []) if isinstance(item, dict)
-                    else getattr(item, "citations", None) or []
-                )
-                for cit in cits:
-                    url = cit.get("url", "") if isinstance(cit, dict) else getattr(cit, "url", "")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        title = cit.get("title", "") if isinstance(cit, dict) else getattr(cit, "title", "")
-                        excerpts = cit.get("excerpts", []) if isinstance(cit, dict) else getattr(cit, "excerpts", [])
-                        citations.append({
-                            "type": "source",
-                            "url": url,
-                            "title": title,
-                            "excerpts": excerpts,
-                        })
-        return citations
+        if not basis or not isinstance(basis, list):
+            return []
+
+        unique: Dict[str, Dict[str, Any]] = {}
+        for item in basis:
+            for cit in _as_mapping(item, ("citations",)).get("citations") or []:
+                cit = _as_mapping(cit, ("url", "title", "excerpts"))
+                url = cit.get("url")
+                if url and url not in unique:
+                    unique[url] = {
+                        "type": "source",
+                        "url": url,
+                        "title": cit.get("title") or "",
+                        "excerpts": cit.get("excerpts") or [],
+                    }
+        return list(unique.values())
 
     # ------------------------------------------------------------------
     # Shared utilities
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _error_result(
+        query: str, error: Exception, timestamp: str, backend: str, model: str
+    ) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "query": query,
+            "error": str(error),
+            "timestamp": timestamp,
+            "backend": backend,
+            "model": model,
+        }
+
     def _extract_citations_from_text(self, text: str) -> List[Dict[str, str]]:
         """Extract DOIs and academic URLs from response text as fallback."""
-        citations = []
-
-        doi_pattern = r'(?:doi[:\s]*|https?://(?:dx\.)?doi\.org/)(10\.[0-9]{4,}/[^\s\)\]\,\[\<\>]+)'
-        doi_matches = re.findall(doi_pattern, text, re.IGNORECASE)
-        seen_dois = set()
-
-        for doi in doi_matches:
-            doi_clean = doi.strip().rstrip(".,;:)]")
-            if doi_clean and doi_clean not in seen_dois:
-                seen_dois.add(doi_clean)
-                citations.append({
-                    "type": "doi",
-                    "doi": doi_clean,
-                    "url": f"https://doi.org/{doi_clean}",
-                })
-
-        url_pattern = (
-            r'https?://[^\s\)\]\,\<\>\"\']+(?:arxiv\.org|pubmed|ncbi\.nlm\.nih\.gov|'
-            r'nature\.com|science\.org|wiley\.com|springer\.com|ieee\.org|acm\.org)'
-            r'[^\s\)\]\,\<\>\"\']*'
-        )
-        url_matches = re.findall(url_pattern, text, re.IGNORECASE)
-        seen_urls = set()
+        # dict.fromkeys drops repeats while keeping first-seen order.
+        dois = dict.fromkeys(_DOI_RE.findall(text))
+        urls = dict.fromkeys(_ACADEMIC_URL_RE.findall(text))
 
-        for url in url_matches:
-            url_clean = url.rstrip(".")
-            if url_clean not in seen_urls:
-                seen_urls.add(url_clean)
-                citations.append({"type": "url", "url": url_clean})
-
-        return citations
+        return [
+            {"type": "doi", "doi": doi, "url": f"https://doi.org/{doi}"} for doi in dois
+        ] + [{"type": "url", "url": url} for url in urls]
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def lookup(self, query: str) -> Dict[str, Any]:
+    def lookup(
+        self, query: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """Perform a research lookup, routing to the best backend.
 
         parallel-cli search is used by default (fast, cost-effective).
-        Parallel Chat API is used only when deep/exhaustive research is requested.
+        Parallel Chat API is used only when deep/exhaustive research is requested;
+        its report text is passed to `on_delta` as it is generated.
         """
         backend = self._select_backend(query)
         print(f"[Research] Backend: {backend} | Query: {query[:80]}...", file=sys.stderr)
 
+        key, cached = self._cache_lookup(backend, query)
+        if cached is not None:
+            return cached
+
         if backend == "parallel-chat":
-            return self._parallel_chat_lookup(query)
+            result = self._parallel_chat_lookup(query, on_delta=on_delta)
         else:
-            return self._parallel_cli_lookup(query)
+            result = self._parallel_cli_lookup(query)
 
-    def batch_lookup(self, queries: List[str], delay: float = 1.0) -> List[Dict[str, Any]]:
-        """Perform multiple research lookups with delay between requests."""
-        results = []
-        for i, query in enumerate(queries):
-            if i > 0 and delay > 0:
-                time.sleep(delay)
-            result = self.lookup(query)
-            results.append(result)
-            print(f"[Research] Completed query {i+1}/{len(queries)}: {query[:50]}...", file=sys.stderr)
-        return results
+        self._cache_store(key, result)
+        return result
+
+    async def lookup_async(
+        self, query: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Async variant of lookup(); see batch_lookup_async() for fan-out."""
+        backend = self._select_backend(query)
+        print(f"[Research] Backend: {backend} | Query: {query[:80]}...", file=sys.stderr)
+
+        key, cached = self._cache_lookup(backend, query)
+        if cached is not None:
+            return cached
+
+        if backend == "parallel-chat":
+            result = await self._parallel_chat_lookup_async(query, on_delta=on_delta)
+        else:
+            result = await self._parallel_cli_lookup_async(query)
+
+        self._cache_store(key, result)
+        return result
+
+    def _cache_lookup(self, backend: str, query: str):
+        """Return (key, cached_result); both are None when caching is disabled."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(backend, query)
+        cached = self.cache.get(key)
+        if cached is not None:
+            print("[Research] Cache hit", file=sys.stderr)
+            cached["cached"] = True
+        return key, cached
+
+    def _cache_store(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        if self.cache is not None and key is not None and result["success"]:
+            ttl = self.cache_ttl
+            if _RECENCY_KEYWORDS_RE.search(result["query"]) is not None:
+                ttl = min(ttl, RECENT_CACHE_TTL)
+            self.cache.set(key, result, ttl)
+
+    def batch_lookup(
+        self, queries: List[str], delay: float = 1.0, max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Perform multiple research lookups concurrently.
+
+        Up to `max_workers` lookups run at once. `delay` is the minimum gap in
+        seconds between starting two lookups, to respect provider rate limits.
+        Results are returned in the same order as `queries`.
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        start_lock = threading.Lock()
+        next_start = 0.0
+
+        def run(query: str) -> Dict[str, Any]:
+            nonlocal next_start
+            if delay > 0:
+                with start_lock:
+                    wait = next_start - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    next_start = time.monotonic() + delay
+            return self.lookup(query)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {pool.submit(run, query): query for query in queries}
+            for done, future in enumerate(as_completed(futures), 1):
+                query = futures[future]
+                print(f"[Research] Completed query {done}/{len(queries)}: {query[:50]}...", file=sys.stderr)
+            return [future.result() for future in futures]
+
+    async def batch_lookup_async(
+        self, queries: List[str], concurrency: int = 8, delay: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """Run many lookups on one event loop, at most `concurrency` at once.
+
+        As in batch_lookup(), `delay` is the minimum gap in seconds between
+        starting two lookups. Results are returned in the same order as `queries`.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        start_lock = asyncio.Lock()
+        next_start = 0.0
+        done = 0
+
+        async def run(query: str) -> Dict[str, Any]:
+            nonlocal done, next_start
+            async with semaphore:
+                if delay > 0:
+                    async with start_lock:
+                        wait = next_start - time.monotonic()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                        next_start = time.monotonic() + delay
+                result = await self.lookup_async(query)
+            done += 1
+            print(f"[Research] Completed query {done}/{len(queries)}: {query[:50]}...", file=sys.stderr)
+            return result
+
+        return await asyncio.gather(*(run(query) for query in queries))
 
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize CLI results as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+
 def main():
     """Command-line interface for the research lookup tool."""
     import argparse
@@ -422,6 +838,7 @@ Examples:
 
   # Deep research (uses Parallel Chat API - slow but comprehensive)
   python research_lookup.py "comprehensive review of mRNA vaccine mechanisms" --force-backend parallel-chat
+  python research_lookup.py "comprehensive review of mRNA vaccine mechanisms" --stream  # watch it arrive
 
   # Force a specific backend
   python research_lookup.py "topic" --force-backend parallel-cli
@@ -432,10 +849,16 @@ Examples:
 
   # JSON output
   python research_lookup.py "topic" --json -o results.json
+
+  # Skip the result cache (~/.cache/research_lookup, 24h by default)
+  python research_lookup.py "topic" --no-cache
         """,
     )
     parser.add_argument("query", nargs="?", help="Research query to look up")
     parser.add_argument("--batch", nargs="+", help="Run multiple queries")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Maximum batch queries in flight at once; starts are still "
+                             "spaced at least 1s apart (default: 4)")
     parser.add_argument(
         "--force-backend",
         choices=["parallel-cli", "parallel-chat"],
@@ -443,6 +866,13 @@ Examples:
     )
     parser.add_argument("-o", "--output", help="Write output to file")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--stream", action="store_true",
+                        help="Echo deep-research reports to stderr as they are generated")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always run the lookup; do not read or write the result cache")
+    parser.add_argument("--cache-ttl", type=float, default=None,
+                        help="Cache lifetime in seconds (default: 24h; at most 1h for "
+                             "queries asking for latest/recent results)")
 
     args = parser.parse_args()
 
@@ -450,11 +880,9 @@ Examples:
     if args.output:
         output_file = open(args.output, "w", encoding="utf-8")
 
-    def write_output(text):
-        if output_file:
-            output_file.write(text + "\n")
-        else:
-            print(text)
+    # Text output is collected here and written in one call at the end.
+    lines: List[str] = []
+    write_output = lines.append
 
     has_parallel_cli = True  # will be checked inside ResearchLookup
     has_parallel_chat = bool(os.getenv("PARALLEL_API_KEY"))
@@ -466,17 +894,28 @@ Examples:
         return 1
 
     try:
-        research = ResearchLookup(force_backend=args.force_backend)
+        research = ResearchLookup(
+            force_backend=args.force_backend,
+            cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+        )
 
         if args.batch:
             print(f"Running batch research for {len(args.batch)} queries...", file=sys.stderr)
-            results = research.batch_lookup(args.batch)
+            import asyncio
+
+            results = asyncio.run(research.batch_lookup_async(args.batch, concurrency=args.workers))
         else:
             print(f"Researching: {args.query}", file=sys.stderr)
-            results = [research.lookup(args.query)]
+            on_delta = None
+            if args.stream:
+                def on_delta(delta):
+                    sys.stderr.write(delta)
+                    sys.stderr.flush()
+            results = [research.lookup(args.query, on_delta=on_delta)]
 
         if args.json:
-            write_output(json.dumps(results, indent=2, ensure_ascii=False, default=str))
+            (output_file or sys.stdout).write(_json_dumps(results) + "\n")
             if output_file:
                 output_file.close()
             return 0
@@ -517,6 +956,7 @@ Examples:
             else:
                 write_output(f"\nError in query {i+1}: {result['error']}")
 
+        (output_file or sys.stdout).write("\n".join(lines) + "\n")
         if output_file:
             output_file.close()
         return 0
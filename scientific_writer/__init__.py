@@ -30,9 +30,13 @@ Example:
         > Create a NeurIPS paper on transformer attention mechanisms
 """
 
-from .api import generate_paper
+from typing import TYPE_CHECKING, Any
+
 from .models import ProgressUpdate, TextUpdate, PaperResult, PaperMetadata, PaperFiles, TokenUsage
 
+if TYPE_CHECKING:
+    from .api import generate_paper
+
 __version__ = "2.16.0"
 __author__ = "K-Dense"
 __license__ = "MIT"
@@ -47,3 +51,12 @@ __all__ = [
     "TokenUsage",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    # generate_paper pulls in the agent SDK (slow to import); load it on first
+    # use so the CLI entry point and `import scientific_writer.models` stay fast.
+    if name == "generate_paper":
+        from .api import generate_paper
+
+        return generate_paper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
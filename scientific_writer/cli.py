@@ -6,15 +6,17 @@ A command-line interface for scientific writing.
 
 import argparse
 import os
+import re
+import signal
 import sys
+import threading
 import time
 import asyncio
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from claude_agent_sdk import query, ClaudeAgentOptions
-from claude_agent_sdk.types import HookMatcher, StopHookInput, HookContext
+if TYPE_CHECKING:
+    from claude_agent_sdk.types import HookContext, StopHookInput
 
 from .core import (
     EFFORT_LEVEL_MODELS,
@@ -35,6 +37,348 @@ def _resolve_model(effort_level: str = "medium") -> str:
     return EFFORT_LEVEL_MODELS.get(effort_level, EFFORT_LEVEL_MODELS["medium"])
 
 
+# Token counters accumulated per session; the names match TokenUsage's fields.
+_USAGE_KEYS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+
+# Phrases that mean the user wants a fresh paper rather than the current one.
+_NEW_PAPER_KEYWORDS = (
+    "new paper", "start fresh", "start afresh", "create new", "different paper", "another paper",
+    "new presentation", "new poster", "different presentation", "another presentation",
+)
+
+# Session rules appended to WRITER.md's system prompt (filled in with str.format).
+_EXTRA_SYSTEM_TMPL = """
+IMPORTANT - WORKING DIRECTORY:
+- Your working directory is: {cwd}
+- ALWAYS create writing_outputs folder in this directory: {cwd}/writing_outputs/
+- NEVER write to /tmp/ or any other temporary directory
+- All paper outputs MUST go to: {cwd}/writing_outputs/<timestamp>_<description>/
+
+IMPORTANT - CONVERSATION CONTINUITY:
+- The user will provide context in their prompt if they want to continue working on an existing paper
+- If the prompt includes [CONTEXT: You are currently working on a paper in: ...], continue editing that paper
+- If no such context is provided, this is a NEW paper request - create a new paper directory
+- Do NOT assume there's an existing paper unless explicitly told in the prompt context
+- Each new chat session should start with a new paper unless context says otherwise
+"""
+
+# Banner printed when an interactive session starts (filled in with str.format).
+_WELCOME_BANNER = """\
+======================================================================
+Scientific Writer CLI
+======================================================================
+
+Welcome! I'm your scientific writing assistant.
+
+I can help you with:
+  • Writing scientific papers (IMRaD structure)
+  • Literature reviews and citation management
+  • Peer review feedback
+  • Real-time research lookup using Parallel web search
+  • Native web search for current information
+  • Document manipulation (docx, pdf, pptx, xlsx)
+
+📋 Workflow:
+  1. I'll present a brief plan and immediately start execution
+  2. I'll provide continuous updates during the process
+  3. All outputs saved to: writing_outputs/<timestamp_description>/
+  4. Progress tracked in real-time in progress.md
+
+📁 Working directory: {cwd}
+📁 Output folder: {output_folder}
+
+📦 Data Files:
+  • Place files in the 'data/' folder to include them in your paper
+  • Manuscript files (.tex) → copied to drafts/ for EDITING
+  • Context files (.md, .docx, .pdf) → copied to sources/ for REFERENCE
+  • Data files (csv, txt, json, etc.) → copied to paper's data/ folder
+  • Images (png, jpg, svg, etc.) → copied to paper's figures/ folder
+  • Other files → copied to sources/ for CONTEXT
+  • Original files are automatically deleted after copying
+
+🤖 Intelligent Paper Detection:
+  • I automatically detect when you're referring to a previous paper/presentation
+  • Continue: 'continue', 'update', 'edit', 'the paper', 'the presentation', etc.
+  • Search: 'look for', 'find', 'show me', 'where is', etc.
+  • Or reference the topic (e.g., 'find the acoustics paper')
+  • Say 'new paper' to explicitly start a fresh paper
+
+Type 'exit' or 'quit' to end the session.
+Type 'help' for usage tips.
+======================================================================
+
+"""
+
+# Text shown by the 'help' command.
+_HELP_BANNER = """\
+
+======================================================================
+HELP - Scientific Writer CLI
+======================================================================
+
+📝 What I Can Do:
+  • Create complete scientific papers (LaTeX, Word, Markdown)
+  • Literature reviews with citation management
+  • Peer review feedback on drafts
+  • Real-time research lookup using Parallel web search
+  • Native web search for current events and general information
+  • Format citations in any style (APA, IEEE, Nature, etc.)
+  • Document manipulation (docx, pdf, pptx, xlsx)
+
+🔄 How I Work:
+  1. You describe what you need
+  2. I present a brief plan and start execution immediately
+  3. I provide continuous progress updates
+  4. All files organized in writing_outputs/ folder
+
+💡 Example Requests:
+  'Create a NeurIPS paper on transformer attention mechanisms'
+  'Write a literature review on CRISPR gene editing'
+  'Review my methods section in draft.docx'
+  'Research recent advances in quantum computing 2024'
+  'Create a Nature paper on climate change impacts'
+  'Format 20 citations in IEEE style'
+
+📁 File Organization:
+  All work saved to: writing_outputs/<timestamp>_<description>/
+  - drafts/ - Working versions
+  - final/ - Completed documents
+  - references/ - Bibliography files
+  - figures/ - Images and charts
+  - data/ - Data files for the paper
+  - sources/ - Context/reference materials
+  - progress.md - Real-time progress log
+  - SUMMARY.md - Project summary and instructions
+
+📦 Data Files:
+  Place files in the 'data/' folder at project root:
+  • Manuscript files (.tex) → copied to drafts/ for EDITING
+  • Context files (.md, .docx, .pdf) → copied to sources/ for REFERENCE
+  • Data files (csv, txt, json, etc.) → copied to paper's data/
+  • Images (png, jpg, svg, etc.) → copied to paper's figures/
+  • Other files → copied to sources/ for CONTEXT
+  • Files are used as context for the paper
+  • Original files automatically deleted after copying
+
+🎯 Pro Tips:
+  • Be specific about journal/conference (e.g., 'Nature', 'NeurIPS')
+  • Mention citation style if you have a preference
+  • I'll make smart defaults if you don't specify details
+  • Check progress.md for detailed execution logs
+
+🔄 Intelligent Paper Detection:
+  • I automatically detect when you're referring to a previous paper/presentation
+  • Continue working: 'continue the paper', 'update my presentation', 'edit the poster'
+  • Search/find: 'look for the X paper', 'find the presentation about Y'
+  • Or mention the topic: 'show me the acoustics paper'
+  • Keywords like 'continue', 'update', 'edit', 'look for', 'find' trigger detection
+  • I'll find the most relevant paper/presentation based on topic matching
+  • Say 'new paper' or 'start fresh' to explicitly begin a new one
+  • Current working paper/presentation is tracked throughout the session
+======================================================================
+"""
+
+# Subdirectories whose listings scan_paper_directory reports on.
+_PAPER_SUBDIRS = ("final", "drafts", "references", "figures", "data", "sources")
+
+# Item markers ("1." or "2)") of a numbered list typed on one line; see _split_numbered_tasks.
+_TASK_MARKER_RE = re.compile(r"(?:^|(?<=\s))(\d{1,2})[.)]\s+")
+
+# process_data_files result lists, and how _print_processed_summary describes them.
+_SUMMARY_SPEC = (
+    ("manuscript_files", ".tex manuscript(s) to drafts/ [EDITING MODE]"),
+    ("source_files", "source/context file(s) to sources/"),
+    ("data_files", "data file(s) to data/"),
+    ("image_files", "image(s) to figures/"),
+)
+
+# Filler words left out of the <description> part of new paper directory names.
+_DESCRIPTION_STOPWORDS = frozenset((
+    "a", "an", "the", "on", "of", "for", "and", "to", "in", "with", "about", "my", "me",
+    "please", "write", "create", "make", "new", "paper", "using", "from", "this", "these",
+))
+
+# A paper directory (writing_outputs/<timestamp>_<description>) named in agent output;
+# it ends on a word character or hyphen so a trailing sentence period isn't captured.
+_PAPER_DIR_RE = re.compile(r"writing_outputs/(\d{8}_\d{6}_[\w.-]*[\w-])")
+
+# Last scan per paper directory, with the directory mtimes it was taken at.
+_scan_cache: Dict[Path, Tuple[Tuple[int, ...], Dict[str, Any]]] = {}
+
+
+def _split_numbered_tasks(text: str) -> Tuple[str, List[str]]:
+    """
+    Split "intro 1. task 2. task 3. task" into the intro and the numbered tasks.
+
+    Only markers counting up from 1 are used, so numbers inside the tasks
+    themselves don't split them. Returns no tasks unless there are at least three.
+    """
+    expected = 1
+    starts = []
+    for match in _TASK_MARKER_RE.finditer(text):
+        if int(match.group(1)) == expected:
+            starts.append(match)
+            expected += 1
+    if len(starts) < 3:
+        return text, []
+
+    ends = [match.start() for match in starts[1:]] + [len(text)]
+    tasks = [text[match.end():end].strip().rstrip(";,").strip() for match, end in zip(starts, ends, strict=True)]
+    return text[:starts[0].start()].strip(), tasks
+
+
+def _batch_prompt(intro: str, tasks: List[str]) -> str:
+    """Restate a multi-part request as explicit, independently answered tasks."""
+    lines = [intro] if intro else []
+    lines.append(
+        f"Handle the following {len(tasks)} independent tasks in this one response, in order. "
+        "Put each result under its own heading, '### Task <number>'."
+    )
+    lines.extend(f"{number}. {task}" for number, task in enumerate(tasks, 1))
+    return "\n".join(lines)
+
+
+def _print_processed_summary(processed_info: Dict[str, Any]) -> None:
+    """Report what process_data_files copied where, in a single write."""
+    lines = [
+        f"   ✓ Copied {count} {label}\n"
+        for key, label in _SUMMARY_SPEC
+        if (count := len(processed_info.get(key, ())))
+    ]
+    lines.append("   ✓ Deleted original files from data folder\n\n")
+    sys.stdout.write("".join(lines))
+
+
+def _start_input(prompt: str) -> "asyncio.Future[str]":
+    """
+    Call input(prompt) on a daemon thread and return a future for the line.
+
+    Unlike asyncio.to_thread, a daemon thread still blocked in input() doesn't
+    keep asyncio.run's executor shutdown (or the interpreter) waiting at exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            setter, value = future.set_exception, e
+        else:
+            setter, value = future.set_result, line
+        try:
+            loop.call_soon_threadsafe(deliver, setter, value)
+        except RuntimeError:
+            pass  # the session ended while waiting for this line
+
+    threading.Thread(target=read, name="scientific-writer-input", daemon=True).start()
+    return future
+
+
+def _prewarm_paper_scan(paper_dir: Path) -> None:
+    """Fill the scan cache in the background; a failure just leaves it cold."""
+    try:
+        _scan_paper_cached(paper_dir)
+    except OSError:
+        pass
+
+
+def _create_paper_directory(output_folder: Path, request: str) -> Path:
+    """
+    Create writing_outputs/<timestamp>_<description>/ with the standard subfolders.
+
+    The description is taken from the first few meaningful words of the
+    user's request, so detect_paper_reference can match on the topic later.
+    A numeric suffix keeps two same-second requests on the same topic apart.
+    The directory starts with the progress.md log the agent appends to.
+    """
+    words = [
+        w for w in re.findall(r"[a-z0-9]+", request.lower())
+        if w not in _DESCRIPTION_STOPWORDS and not w.isdigit()
+    ]
+    description = "_".join(words[:4]) or "paper"
+    base_name = f"{time.strftime('%Y%m%d_%H%M%S')}_{description}"
+    paper_dir = output_folder / base_name
+    suffix = 1
+    while True:
+        try:
+            paper_dir.mkdir(parents=True)
+            break
+        except FileExistsError:
+            suffix += 1
+            paper_dir = output_folder / f"{base_name}_{suffix}"
+    for name in _PAPER_SUBDIRS:
+        (paper_dir / name).mkdir()
+    (paper_dir / "progress.md").write_text(
+        f"# Progress Log\n\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Project directory created for: {request}\n",
+        encoding="utf-8",
+    )
+    return paper_dir
+
+
+def _paper_dir_names(output_folder: Path) -> Set[str]:
+    """Names of the paper directories currently in the output folder."""
+    # scandir reads entry types from the listing itself: no stat() per entry
+    try:
+        with os.scandir(output_folder) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def _find_new_paper_dir(output_folder: Path, known_dirs: Set[str], response_text: str) -> Optional[Path]:
+    """
+    Identify the paper directory created since known_dirs was taken.
+
+    A single new directory is unambiguous. Otherwise fall back to the last
+    new (or, failing that, existing) paper directory named in the agent's reply.
+    """
+    created = _paper_dir_names(output_folder) - known_dirs
+    if len(created) == 1:
+        return output_folder / created.pop()
+
+    mentioned = [
+        name for name in _PAPER_DIR_RE.findall(response_text)
+        if (output_folder / name).is_dir()
+    ]
+    for name in reversed(mentioned):
+        if name in created:
+            return output_folder / name
+    return output_folder / mentioned[-1] if mentioned else None
+
+
+def _paper_mtimes(paper_dir: Path) -> Tuple[int, ...]:
+    """mtimes of a paper directory and its subdirectories (-1 if missing)."""
+    mtimes = []
+    for directory in (paper_dir, *(paper_dir / name for name in _PAPER_SUBDIRS)):
+        try:
+            mtimes.append(directory.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(-1)
+    return tuple(mtimes)
+
+
+def _scan_paper_cached(paper_dir: Path) -> Dict[str, Any]:
+    """
+    scan_paper_directory, reusing the previous result while nothing changed.
+
+    Adding, removing or renaming a file bumps its parent directory's mtime,
+    so a handful of stat() calls replace a full walk of the paper on turns
+    where the agent did not touch it.
+    """
+    mtimes = _paper_mtimes(paper_dir)
+    cached = _scan_cache.get(paper_dir)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
+    paper_info = scan_paper_directory(paper_dir)
+    _scan_cache[paper_dir] = (mtimes, paper_info)
+    return paper_info
+
+
 def create_completion_check_stop_hook(auto_continue: bool = True):
     """
     Create a stop hook that optionally forces continuation.
@@ -44,9 +388,9 @@ def create_completion_check_stop_hook(auto_continue: bool = True):
                       If False, allow normal stopping behavior.
     """
     async def completion_check_stop_hook(
-        hook_input: StopHookInput,
+        hook_input: "StopHookInput",
         matcher: str | None,
-        context: HookContext,
+        context: "HookContext",
     ) -> dict:
         """
         Stop hook that checks if the task is complete before allowing stop.
@@ -78,11 +422,18 @@ async def main(
     Returns:
         TokenUsage object if track_token_usage is True, None otherwise
     """
+    # The agent SDK is imported here rather than at module level: it is by far
+    # the slowest import, and `scientific-writer --help` never needs it
+    from claude_agent_sdk import ClaudeAgentOptions, query
+    from claude_agent_sdk.types import AssistantMessage, HookMatcher, ResultMessage, TextBlock
+
     # Explicitly load .env file from current working directory
     # This ensures API keys are available in the shell environment
     cwd_resolved = Path.cwd().resolve()
     env_file = cwd_resolved / ".env"
     if env_file.exists():
+        from dotenv import load_dotenv
+
         load_dotenv(dotenv_path=env_file, override=True)
 
     # Get API key (verify it exists)
@@ -109,25 +460,15 @@ async def main(
     # Add conversation continuity instruction
     # Note: The Python CLI handles session tracking via current_paper_path
     # These instructions only apply WITHIN a single CLI session, not across different chat sessions
-    system_instructions += "\n\n" + f"""
-IMPORTANT - WORKING DIRECTORY:
-- Your working directory is: {cwd}
-- ALWAYS create writing_outputs folder in this directory: {cwd}/writing_outputs/
-- NEVER write to /tmp/ or any other temporary directory
-- All paper outputs MUST go to: {cwd}/writing_outputs/<timestamp>_<description>/
-
-IMPORTANT - CONVERSATION CONTINUITY:
-- The user will provide context in their prompt if they want to continue working on an existing paper
-- If the prompt includes [CONTEXT: You are currently working on a paper in: ...], continue editing that paper
-- If no such context is provided, this is a NEW paper request - create a new paper directory
-- Do NOT assume there's an existing paper unless explicitly told in the prompt context
-- Each new chat session should start with a new paper unless context says otherwise
-"""
+    system_instructions += "\n\n" + _EXTRA_SYSTEM_TMPL.format(cwd=cwd)
 
     # Check if auto-continue is enabled via environment variable
     # Default to True to ensure tasks complete fully
     auto_continue = os.environ.get("SCIENTIFIC_WRITER_AUTO_CONTINUE", "true").lower() in ("true", "1", "yes")
 
+    # Opt-in: restate numbered multi-part requests as an explicit task batch
+    batch_tasks = os.environ.get("SCIENTIFIC_WRITER_BATCH", "false").lower() in ("true", "1", "yes")
+
     # Configure agent options with stop hook for completion checking
     options = ClaudeAgentOptions(
         system_prompt=system_instructions,
@@ -148,396 +489,256 @@ IMPORTANT - CONVERSATION CONTINUITY:
     )
 
     # Track conversation state
-    current_paper_path = None
+    current_paper_path: Optional[Path] = None
 
     # Token usage tracking (accumulated across all queries in session)
-    total_input_tokens = 0
-    total_output_tokens = 0
-    total_cache_creation_tokens = 0
-    total_cache_read_tokens = 0
-
-    # Print welcome message
-    print("=" * 70)
-    print("Scientific Writer CLI")
-    print("=" * 70)
-    print("\nWelcome! I'm your scientific writing assistant.")
-    print("\nI can help you with:")
-    print("  • Writing scientific papers (IMRaD structure)")
-    print("  • Literature reviews and citation management")
-    print("  • Peer review feedback")
-    print("  • Real-time research lookup using Parallel web search")
-    print("  • Native web search for current information")
-    print("  • Document manipulation (docx, pdf, pptx, xlsx)")
-    print("\n📋 Workflow:")
-    print("  1. I'll present a brief plan and immediately start execution")
-    print("  2. I'll provide continuous updates during the process")
-    print("  3. All outputs saved to: writing_outputs/<timestamp_description>/")
-    print("  4. Progress tracked in real-time in progress.md")
-    print(f"\n📁 Working directory: {cwd}")
-    print(f"📁 Output folder: {output_folder}")
-    print("\n📦 Data Files:")
-    print("  • Place files in the 'data/' folder to include them in your paper")
-    print("  • Manuscript files (.tex) → copied to drafts/ for EDITING")
-    print("  • Context files (.md, .docx, .pdf) → copied to sources/ for REFERENCE")
-    print("  • Data files (csv, txt, json, etc.) → copied to paper's data/ folder")
-    print("  • Images (png, jpg, svg, etc.) → copied to paper's figures/ folder")
-    print("  • Other files → copied to sources/ for CONTEXT")
-    print("  • Original files are automatically deleted after copying")
-    print("\n🤖 Intelligent Paper Detection:")
-    print("  • I automatically detect when you're referring to a previous paper/presentation")
-    print("  • Continue: 'continue', 'update', 'edit', 'the paper', 'the presentation', etc.")
-    print("  • Search: 'look for', 'find', 'show me', 'where is', etc.")
-    print("  • Or reference the topic (e.g., 'find the acoustics paper')")
-    print("  • Say 'new paper' to explicitly start a fresh paper")
-    print("\nType 'exit' or 'quit' to end the session.")
-    print("Type 'help' for usage tips.")
-    print("=" * 70)
-    print()
+    usage_totals = dict.fromkeys(_USAGE_KEYS, 0)
 
-    # Main loop
-    while True:
-        try:
-            # Get user input
-            user_input = input("\n> ").strip()
-
-            # Handle special commands
-            if user_input.lower() in ["exit", "quit"]:
-                print("\nThank you for using Scientific Writer CLI. Goodbye!")
-                # Return token usage if tracking was enabled
-                if track_token_usage:
-                    return TokenUsage(
-                        input_tokens=total_input_tokens,
-                        output_tokens=total_output_tokens,
-                        cache_creation_input_tokens=total_cache_creation_tokens,
-                        cache_read_input_tokens=total_cache_read_tokens,
-                    )
-                return None
+    # Background scan started before each prompt
+    prewarm: Optional["asyncio.Task[None]"] = None
 
-            if user_input.lower() == "help":
-                _print_help()
-                continue
-
-            if not user_input:
-                continue
-
-            # Get all existing papers
-            existing_papers = find_existing_papers(output_folder)
-
-            # Check if user wants to start a new paper
-            new_paper_keywords = [
-                "new paper", "start fresh", "start afresh", "create new", "different paper", "another paper",
-                "new presentation", "new poster", "different presentation", "another presentation"
-            ]
-            is_new_paper_request = any(keyword in user_input.lower() for keyword in new_paper_keywords)
-
-            # Try to detect reference to existing paper
-            detected_paper_path = None
-            if not is_new_paper_request:
-                detected_paper_path = detect_paper_reference(user_input, existing_papers)
-
-                # If we detected a paper reference and it's different from current, update it
-                if detected_paper_path and str(detected_paper_path) != current_paper_path:
-                    current_paper_path = str(detected_paper_path)
-                    print(f"\n🔍 Detected reference to existing paper: {detected_paper_path.name}")
-                    print(f"📂 Working on: {current_paper_path}")
-
-                    # Show what files exist in this paper
-                    paper_info = scan_paper_directory(detected_paper_path)
-                    file_count = sum([
-                        1 if paper_info['tex_final'] else 0,
-                        1 if paper_info['pdf_final'] else 0,
-                        len(paper_info['tex_drafts']),
-                        len(paper_info['pdf_drafts']),
-                        len(paper_info['figures']),
-                        len(paper_info['data']),
-                        len(paper_info['sources']),
-                        1 if paper_info['bibliography'] else 0,
-                        1 if paper_info['progress_log'] else 0,
-                        1 if paper_info['summary'] else 0,
-                    ])
-                    print(f"📄 Found {file_count} file(s) in this directory\n")
-
-                elif detected_paper_path and str(detected_paper_path) == current_paper_path:
-                    # Already working on the right paper, just confirm
-                    print(f"📂 Continuing with: {Path(current_paper_path).name}\n")
-
-            # Check for data files and process them if we have a current paper
-            data_context = ""
-            data_files = get_data_files(cwd)
-
-            # PHASE 1: Handle new paper with data files - create directory first
-            if data_files and not current_paper_path and (is_new_paper_request or not current_paper_path):
-                print(f"\n📦 Found {len(data_files)} file(s) in data folder.")
-                print("📝 Starting a new paper...")
-                print("⏳ Step 1/2: Creating paper directory...\n")
-
-                # Create directory structure first
-                directory_prompt = f"""Create a new paper directory structure in writing_outputs/ following the standard format:
-writing_outputs/YYYYMMDD_HHMMSS_<description>/
-
-Create these folders:
-- drafts/
-- final/
-- references/
-- figures/
-- data/
-- sources/
-
-IMPORTANT:
-1. Only create the directory structure and progress.md file
-2. Do NOT start writing the paper yet
-3. Report back the directory path you created
-4. Wait for further instructions
-
-Based on the user request: {user_input}"""
-
-                # Send directory creation request
-                async for message in query(prompt=directory_prompt, options=options):
-                    # Track token usage silently
-                    if track_token_usage and hasattr(message, "usage") and message.usage:
-                        usage = message.usage
-                        total_input_tokens += getattr(usage, "input_tokens", 0)
-                        total_output_tokens += getattr(usage, "output_tokens", 0)
-                        total_cache_creation_tokens += getattr(usage, "cache_creation_input_tokens", 0)
-                        total_cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0)
+    # Line being read from the terminal; it outlives a Ctrl-C at the prompt
+    pending_input: Optional["asyncio.Future[str]"] = None
 
-                    if hasattr(message, "content") and message.content:
-                        for block in message.content:
-                            if hasattr(block, "text"):
-                                print(block.text, end="", flush=True)
+    # Ctrl-C cancels this task, which the loop below turns into "Interrupted"
+    # and a fresh prompt (Windows keeps asyncio.run's own SIGINT handling)
+    main_task = asyncio.current_task()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, main_task.cancel)
+    except (NotImplementedError, RuntimeError):
+        pass
 
-                print("\n")
+    # Print welcome message
+    sys.stdout.write(_WELCOME_BANNER.format(cwd=cwd, output_folder=output_folder))
 
-                # Detect the newly created directory
-                await asyncio.sleep(1)  # Brief pause to ensure filesystem is updated
+    # Main loop
+    try:
+        while True:
+            try:
+                # Re-scan the current paper (which the last query likely changed) while
+                # the user is typing, so this turn's scan finds it already cached. One
+                # left over from an interrupted prompt is still running; keep that one.
+                if current_paper_path is not None and prewarm is None:
+                    prewarm = asyncio.create_task(asyncio.to_thread(_prewarm_paper_scan, current_paper_path))
+
+                # Get user input; after a Ctrl-C the earlier read is still waiting
+                if pending_input is None:
+                    pending_input = _start_input("\n> ")
+                else:
+                    sys.stdout.write("\n> ")
+                    sys.stdout.flush()
                 try:
-                    paper_dirs = [d for d in output_folder.iterdir() if d.is_dir()]
-                    if paper_dirs:
-                        most_recent = max(paper_dirs, key=lambda d: d.stat().st_mtime)
-                        time_since_modification = time.time() - most_recent.stat().st_mtime
-
-                        if time_since_modification < 15:  # Within last 15 seconds
-                            current_paper_path = str(most_recent)
-                            print(f"✓ Directory created: {most_recent.name}\n")
-                except Exception as e:
-                    print(f"Warning: Could not detect paper directory: {e}\n")
-
-                # PHASE 2: Process data files before continuing
-                if current_paper_path:
-                    print("⏳ Step 2/2: Processing and copying data files...")
-                    processed_info = process_data_files(cwd, data_files, current_paper_path)
+                    user_input = (await asyncio.shield(pending_input)).strip()
+                finally:
+                    if pending_input.done():
+                        pending_input = None
+                if prewarm is not None:
+                    # Normally finished long before the user pressed Enter. A failed
+                    # warm-up only costs the cache: the turn's own scan reports errors.
+                    task, prewarm = prewarm, None
+                    await asyncio.gather(task, return_exceptions=True)
+                lowered = user_input.lower()
+
+                # Handle special commands
+                if lowered in ["exit", "quit"]:
+                    print("\nThank you for using Scientific Writer CLI. Goodbye!")
+                    # Return token usage if tracking was enabled
+                    if track_token_usage:
+                        return TokenUsage(**usage_totals)
+                    return None
+
+                if lowered == "help":
+                    _print_help()
+                    continue
+
+                if not user_input:
+                    continue
+
+                # Get all existing papers
+                existing_papers = await asyncio.to_thread(find_existing_papers, output_folder)
+
+                # Check if user wants to start a new paper
+                is_new_paper_request = any(keyword in lowered for keyword in _NEW_PAPER_KEYWORDS)
+
+                # Try to detect reference to existing paper
+                detected_paper_path = None
+                if not is_new_paper_request:
+                    detected_paper_path = detect_paper_reference(user_input, existing_papers)
+
+                    # If we detected a paper reference and it's different from current, update it
+                    if detected_paper_path and detected_paper_path != current_paper_path:
+                        current_paper_path = detected_paper_path
+                        print(f"\n🔍 Detected reference to existing paper: {detected_paper_path.name}")
+                        print(f"📂 Working on: {current_paper_path}")
+
+                        # Show what files exist in this paper
+                        paper_info = await asyncio.to_thread(_scan_paper_cached, detected_paper_path)
+                        print(f"📄 Found {paper_info['file_count']} file(s) in this directory\n")
+
+                    elif detected_paper_path and detected_paper_path == current_paper_path:
+                        # Already working on the right paper, just confirm
+                        print(f"📂 Continuing with: {current_paper_path.name}\n")
+
+                # The request as sent to the agent
+                request = user_input
+                if batch_tasks:
+                    intro, tasks = _split_numbered_tasks(user_input)
+                    if tasks:
+                        request = _batch_prompt(intro, tasks)
+                        print(f"🧩 Sending {len(tasks)} tasks as one batch")
+
+                # Check for data files and process them if we have a current paper
+                data_context = ""
+                data_files = await asyncio.to_thread(get_data_files, cwd)
+
+                # New paper with data files: create its directory and copy the files
+                # here, so the agent gets everything in a single query
+                if data_files and (is_new_paper_request or not current_paper_path):
+                    print(f"\n📦 Found {len(data_files)} file(s) in data folder.")
+                    print("📝 Starting a new paper...")
+                    current_paper_path = _create_paper_directory(output_folder, user_input)
+                    print(f"✓ Directory created: {current_paper_path.name}\n")
+
+                    print("⏳ Processing and copying data files...")
+                    processed_info = await asyncio.to_thread(process_data_files, cwd, data_files, str(current_paper_path))
                     if processed_info:
                         data_context = create_data_context_message(processed_info)
-                        manuscript_count = len(processed_info.get('manuscript_files', []))
-                        source_count = len(processed_info.get('source_files', []))
-                        data_count = len(processed_info.get('data_files', []))
-                        image_count = len(processed_info.get('image_files', []))
-                        if manuscript_count > 0:
-                            print(f"   ✓ Copied {manuscript_count} .tex manuscript(s) to drafts/ [EDITING MODE]")
-                        if source_count > 0:
-                            print(f"   ✓ Copied {source_count} source/context file(s) to sources/")
-                        if data_count > 0:
-                            print(f"   ✓ Copied {data_count} data file(s) to data/")
-                        if image_count > 0:
-                            print(f"   ✓ Copied {image_count} image(s) to figures/")
-                        print("   ✓ Deleted original files from data folder\n")
+                        _print_processed_summary(processed_info)
                         print("✅ Files processed. Now starting paper generation...\n")
 
-                # Update prompt to continue with paper generation
-                contextual_prompt = f"""[CONTEXT: You are working on a paper in: {current_paper_path}]
+                    contextual_prompt = f"""[CONTEXT: You are working on a new paper in: {current_paper_path}]
+[INSTRUCTION: This directory (with drafts/, final/, references/, figures/, data/, sources/) was just created for this request. Write all outputs here and do NOT create another paper directory.]
 [FILES HAVE BEEN PROCESSED AND COPIED - see details below]
 {data_context}
 
-Now continue with the actual paper generation for the user's request:
-{user_input}"""
-
-            elif data_files and current_paper_path and not is_new_paper_request:
-                # Existing paper with data files - process immediately
-                print(f"📦 Found {len(data_files)} file(s) in data folder. Processing...")
-                processed_info = process_data_files(cwd, data_files, current_paper_path)
-                if processed_info:
-                    data_context = create_data_context_message(processed_info)
-                    manuscript_count = len(processed_info.get('manuscript_files', []))
-                    source_count = len(processed_info.get('source_files', []))
-                    data_count = len(processed_info.get('data_files', []))
-                    image_count = len(processed_info.get('image_files', []))
-                    if manuscript_count > 0:
-                        print(f"   ✓ Copied {manuscript_count} .tex manuscript(s) to drafts/ [EDITING MODE]")
-                    if source_count > 0:
-                        print(f"   ✓ Copied {source_count} source/context file(s) to sources/")
-                    if data_count > 0:
-                        print(f"   ✓ Copied {data_count} data file(s) to data/")
-                    if image_count > 0:
-                        print(f"   ✓ Copied {image_count} image(s) to figures/")
-                    print("   ✓ Deleted original files from data folder\n")
-
-                # Build contextual prompt for existing paper
-                contextual_prompt = f"""[CONTEXT: You are currently working on a paper in: {current_paper_path}]
+Now start the paper generation for the user's request:
+{request}"""
+
+                elif data_files and current_paper_path and not is_new_paper_request:
+                    # Existing paper with data files - process immediately
+                    print(f"📦 Found {len(data_files)} file(s) in data folder. Processing...")
+                    processed_info = await asyncio.to_thread(process_data_files, cwd, data_files, str(current_paper_path))
+                    if processed_info:
+                        data_context = create_data_context_message(processed_info)
+                        _print_processed_summary(processed_info)
+
+                    # Build contextual prompt for existing paper
+                    contextual_prompt = f"""[CONTEXT: You are currently working on a paper in: {current_paper_path}]
 [INSTRUCTION: Continue editing this existing paper. Do NOT create a new paper directory.]
 {data_context}
-User request: {user_input}"""
-
-            elif is_new_paper_request and not data_files:
-                # New paper without data files - normal flow
-                current_paper_path = None
-                print("📝 Starting a new paper...\n")
-                contextual_prompt = user_input
-
-            elif current_paper_path and not data_files:
-                # Detected existing paper without new data files - provide context about what exists
-                paper_info = scan_paper_directory(Path(current_paper_path))
-
-                # Build a context message about the paper's current state
-                context_parts = [
-                    f"[CONTEXT: You are currently working on a paper in: {current_paper_path}]",
-                    "[INSTRUCTION: Continue working on this existing paper. Do NOT create a new paper directory.]",
-                    "\n📁 Current paper contents:"
-                ]
-
-                # Add information about what files exist
-                if paper_info['tex_final']:
-                    context_parts.append(f"  • Final LaTeX: {Path(paper_info['tex_final']).name}")
-                if paper_info['pdf_final']:
-                    context_parts.append(f"  • Final PDF: {Path(paper_info['pdf_final']).name}")
-                if paper_info['tex_drafts']:
-                    context_parts.append(f"  • Draft LaTeX files: {len(paper_info['tex_drafts'])} file(s)")
-                    for draft in paper_info['tex_drafts']:
-                        context_parts.append(f"    - {Path(draft).name}")
-                if paper_info['pdf_drafts']:
-                    context_parts.append(f"  • Draft PDF files: {len(paper_info['pdf_drafts'])} file(s)")
-                if paper_info['figures']:
-                    context_parts.append(f"  • Figures: {len(paper_info['figures'])} file(s)")
-                if paper_info['data']:
-                    context_parts.append(f"  • Data files: {len(paper_info['data'])} file(s)")
-                if paper_info['sources']:
-                    context_parts.append(f"  • Source/context files: {len(paper_info['sources'])} file(s)")
-                if paper_info['bibliography']:
-                    context_parts.append(f"  • Bibliography: {Path(paper_info['bibliography']).name}")
-                if paper_info['progress_log']:
-                    context_parts.append("  • Progress log: progress.md")
-                if paper_info['summary']:
-                    context_parts.append("  • Summary: SUMMARY.md")
-
-                context_parts.append(f"\nUser request: {user_input}")
-                contextual_prompt = "\n".join(context_parts)
-
-            else:
-                # No data files, no detected paper
-                contextual_prompt = user_input
-
-            # Send query
-            print()  # Add blank line before response
-            async for message in query(prompt=contextual_prompt, options=options):
-                # Track token usage silently
-                if track_token_usage and hasattr(message, "usage") and message.usage:
-                    usage = message.usage
-                    total_input_tokens += getattr(usage, "input_tokens", 0)
-                    total_output_tokens += getattr(usage, "output_tokens", 0)
-                    total_cache_creation_tokens += getattr(usage, "cache_creation_input_tokens", 0)
-                    total_cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0)
-
-                # Handle AssistantMessage with content blocks
-                if hasattr(message, "content") and message.content:
-                    for block in message.content:
-                        if hasattr(block, "text"):
-                            print(block.text, end="", flush=True)
-
-            print()  # Add blank line after response
-
-            # Try to detect if a new paper directory was created (for cases without data files)
-            if not current_paper_path and not data_files:
-                # Look for the most recently modified directory in writing_outputs
-                # Only update if it was modified in the last 10 seconds (indicating it was just created)
-                try:
-                    paper_dirs = [d for d in output_folder.iterdir() if d.is_dir()]
-                    if paper_dirs:
-                        most_recent = max(paper_dirs, key=lambda d: d.stat().st_mtime)
-                        time_since_modification = time.time() - most_recent.stat().st_mtime
-
-                        # Only set as current paper if it was modified very recently (within last 10 seconds)
-                        if time_since_modification < 10:
-                            current_paper_path = str(most_recent)
-                            print(f"\n📂 Working on: {most_recent.name}")
-                except Exception:
-                    pass  # Silently fail if we can't detect the directory
-
-        except KeyboardInterrupt:
-            print("\n\nInterrupted. Type 'exit' to quit or continue with a new prompt.")
-            continue
-        except Exception as e:
-            print(f"\nError: {str(e)}")
-            print("Please try again or type 'exit' to quit.")
+User request: {request}"""
+
+                elif is_new_paper_request and not data_files:
+                    # New paper without data files - normal flow
+                    current_paper_path = None
+                    print("📝 Starting a new paper...\n")
+                    contextual_prompt = request
+
+                elif current_paper_path and not data_files:
+                    # Detected existing paper without new data files - provide context about what exists
+                    paper_info = await asyncio.to_thread(_scan_paper_cached, current_paper_path)
+
+                    # Build a context message about the paper's current state
+                    context_parts = [
+                        f"[CONTEXT: You are currently working on a paper in: {current_paper_path}]",
+                        "[INSTRUCTION: Continue working on this existing paper. Do NOT create a new paper directory.]",
+                        "\n📁 Current paper contents:"
+                    ]
+
+                    # Add information about what files exist
+                    if paper_info['tex_final']:
+                        context_parts.append(f"  • Final LaTeX: {Path(paper_info['tex_final']).name}")
+                    if paper_info['pdf_final']:
+                        context_parts.append(f"  • Final PDF: {Path(paper_info['pdf_final']).name}")
+                    if paper_info['tex_drafts']:
+                        context_parts.append(f"  • Draft LaTeX files: {len(paper_info['tex_drafts'])} file(s)")
+                        for draft in paper_info['tex_drafts']:
+                            context_parts.append(f"    - {Path(draft).name}")
+                    if paper_info['pdf_drafts']:
+                        context_parts.append(f"  • Draft PDF files: {len(paper_info['pdf_drafts'])} file(s)")
+                    if paper_info['figures']:
+                        context_parts.append(f"  • Figures: {len(paper_info['figures'])} file(s)")
+                    if paper_info['data']:
+                        context_parts.append(f"  • Data files: {len(paper_info['data'])} file(s)")
+                    if paper_info['sources']:
+                        context_parts.append(f"  • Source/context files: {len(paper_info['sources'])} file(s)")
+                    if paper_info['bibliography']:
+                        context_parts.append(f"  • Bibliography: {Path(paper_info['bibliography']).name}")
+                    if paper_info['progress_log']:
+                        context_parts.append("  • Progress log: progress.md")
+                    if paper_info['summary']:
+                        context_parts.append("  • Summary: SUMMARY.md")
+
+                    context_parts.append(f"\nUser request: {request}")
+                    contextual_prompt = "\n".join(context_parts)
+
+                else:
+                    # No data files, no detected paper
+                    contextual_prompt = request
+
+                # Without a paper yet, the agent will create one: note what exists now
+                # so the new directory can be told apart afterwards
+                known_dirs = None
+                if not current_paper_path and not data_files:
+                    known_dirs = await asyncio.to_thread(_paper_dir_names, output_folder)
+
+                # Send query
+                print()  # Add blank line before response
+                response_text = []
+                async for message in query(prompt=contextual_prompt, options=options):
+                    # Handle AssistantMessage with content blocks: echo all of a
+                    # message's text with one write and flush
+                    if isinstance(message, AssistantMessage):
+                        texts = [block.text for block in message.content if isinstance(block, TextBlock)]
+                        if texts:
+                            sys.stdout.write("".join(texts))
+                            sys.stdout.flush()
+                            response_text.extend(texts)
+
+                    # Track token usage silently. The SDK reports usage as a plain dict;
+                    # the ResultMessage closing each query carries the query's totals
+                    # (assistant messages repeat per-call usage once per content block).
+                    elif track_token_usage and isinstance(message, ResultMessage) and message.usage:
+                        usage = message.usage
+                        for key in _USAGE_KEYS:
+                            usage_totals[key] += usage.get(key) or 0
+
+                print()  # Add blank line after response
+
+                # Pick up the paper directory this query created, if any
+                if known_dirs is not None:
+                    new_paper = await asyncio.to_thread(
+                        _find_new_paper_dir, output_folder, known_dirs, "".join(response_text)
+                    )
+                    if new_paper:
+                        current_paper_path = new_paper
+                        print(f"\n📂 Working on: {new_paper.name}")
+
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # Clear the cancellation Ctrl-C requested so later awaits run normally
+                uncancel = getattr(main_task, "uncancel", None)  # Python 3.11+
+                if uncancel is not None:
+                    uncancel()
+                print("\n\nInterrupted. Type 'exit' to quit or continue with a new prompt.")
+                continue
+            except Exception as e:
+                print(f"\nError: {str(e)}")
+                print("Please try again or type 'exit' to quit.")
+    finally:
+        # Don't leave a background scan running past the session
+        if prewarm is not None:
+            prewarm.cancel()
+            await asyncio.gather(prewarm, return_exceptions=True)
 
     # Return token usage if tracking was enabled (fallback for any exit path)
     if track_token_usage:
-        return TokenUsage(
-            input_tokens=total_input_tokens,
-            output_tokens=total_output_tokens,
-            cache_creation_input_tokens=total_cache_creation_tokens,
-            cache_read_input_tokens=total_cache_read_tokens,
-        )
+        return TokenUsage(**usage_totals)
     return None
 
 
 def _print_help():
     """Print help information."""
-    print("\n" + "=" * 70)
-    print("HELP - Scientific Writer CLI")
-    print("=" * 70)
-    print("\n📝 What I Can Do:")
-    print("  • Create complete scientific papers (LaTeX, Word, Markdown)")
-    print("  • Literature reviews with citation management")
-    print("  • Peer review feedback on drafts")
-    print("  • Real-time research lookup using Parallel web search")
-    print("  • Native web search for current events and general information")
-    print("  • Format citations in any style (APA, IEEE, Nature, etc.)")
-    print("  • Document manipulation (docx, pdf, pptx, xlsx)")
-    print("\n🔄 How I Work:")
-    print("  1. You describe what you need")
-    print("  2. I present a brief plan and start execution immediately")
-    print("  3. I provide continuous progress updates")
-    print("  4. All files organized in writing_outputs/ folder")
-    print("\n💡 Example Requests:")
-    print("  'Create a NeurIPS paper on transformer attention mechanisms'")
-    print("  'Write a literature review on CRISPR gene editing'")
-    print("  'Review my methods section in draft.docx'")
-    print("  'Research recent advances in quantum computing 2024'")
-    print("  'Create a Nature paper on climate change impacts'")
-    print("  'Format 20 citations in IEEE style'")
-    print("\n📁 File Organization:")
-    print("  All work saved to: writing_outputs/<timestamp>_<description>/")
-    print("  - drafts/ - Working versions")
-    print("  - final/ - Completed documents")
-    print("  - references/ - Bibliography files")
-    print("  - figures/ - Images and charts")
-    print("  - data/ - Data files for the paper")
-    print("  - sources/ - Context/reference materials")
-    print("  - progress.md - Real-time progress log")
-    print("  - SUMMARY.md - Project summary and instructions")
-    print("\n📦 Data Files:")
-    print("  Place files in the 'data/' folder at project root:")
-    print("  • Manuscript files (.tex) → copied to drafts/ for EDITING")
-    print("  • Context files (.md, .docx, .pdf) → copied to sources/ for REFERENCE")
-    print("  • Data files (csv, txt, json, etc.) → copied to paper's data/")
-    print("  • Images (png, jpg, svg, etc.) → copied to paper's figures/")
-    print("  • Other files → copied to sources/ for CONTEXT")
-    print("  • Files are used as context for the paper")
-    print("  • Original files automatically deleted after copying")
-    print("\n🎯 Pro Tips:")
-    print("  • Be specific about journal/conference (e.g., 'Nature', 'NeurIPS')")
-    print("  • Mention citation style if you have a preference")
-    print("  • I'll make smart defaults if you don't specify details")
-    print("  • Check progress.md for detailed execution logs")
-    print("\n🔄 Intelligent Paper Detection:")
-    print("  • I automatically detect when you're referring to a previous paper/presentation")
-    print("  • Continue working: 'continue the paper', 'update my presentation', 'edit the poster'")
-    print("  • Search/find: 'look for the X paper', 'find the presentation about Y'")
-    print("  • Or mention the topic: 'show me the acoustics paper'")
-    print("  • Keywords like 'continue', 'update', 'edit', 'look for', 'find' trigger detection")
-    print("  • I'll find the most relevant paper/presentation based on topic matching")
-    print("  • Say 'new paper' or 'start fresh' to explicitly begin a new one")
-    print("  • Current working paper/presentation is tracked throughout the session")
-    print("=" * 70)
+    sys.stdout.write(_HELP_BANNER)
 
 
 def cli_main():
@@ -1,15 +1,13 @@
 """Core utilities for scientific writer."""
 
+import functools
 import logging
 import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dotenv import load_dotenv
-
-# Load environment variables from .env file if it exists
-load_dotenv()
+from typing import Optional, List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +75,21 @@ def setup_claude_skills(package_dir: Path, work_dir: Path) -> None:
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_default_dotenv() -> None:
+    """
+    Load the nearest .env file once, without overriding variables already set.
+
+    Runs on first use rather than at import, so importing the package (e.g. for
+    `scientific-writer --help`) doesn't pay for python-dotenv. The CLI and API
+    load the working directory's .env with override=True before this runs, so
+    that file still takes precedence.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 def get_api_key(api_key: Optional[str] = None) -> str:
     """
     Get the Anthropic API key.
@@ -90,6 +103,9 @@ def get_api_key(api_key: Optional[str] = None) -> str:
     Raises:
         ValueError: If API key is not found.
     """
+    # Load even when a key is passed: the .env also carries settings such as
+    # PARALLEL_API_KEY that callers read from the environment afterwards
+    _load_default_dotenv()
     if api_key:
         return api_key
 
@@ -246,6 +262,39 @@ def extract_images_from_docx(docx_path: Path, figures_output: Path) -> List[Dict
     return extracted_images
 
 
+def _copy_files(pairs: List[Tuple[Path, Path]], max_workers: int = 8) -> List[Optional[Exception]]:
+    """
+    shutil.copy2 each (source, destination) pair, several at a time.
+
+    copy2 releases the GIL while moving bytes, so a folder of figures copies
+    in parallel. Pairs sharing a destination are copied in order by one
+    worker, so the last one still wins.
+
+    Returns:
+        The exception raised for each pair, or None where the copy succeeded.
+    """
+    errors: List[Optional[Exception]] = [None] * len(pairs)
+    by_destination: Dict[Path, List[int]] = {}
+    for index, (_, destination) in enumerate(pairs):
+        by_destination.setdefault(destination, []).append(index)
+
+    def copy_group(indices: List[int]) -> None:
+        for index in indices:
+            try:
+                shutil.copy2(*pairs[index])
+            except Exception as e:
+                errors[index] = e
+
+    groups = list(by_destination.values())
+    if len(groups) <= 1:
+        for indices in groups:
+            copy_group(indices)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+            list(pool.map(copy_group, groups))
+    return errors
+
+
 def process_data_files(
     cwd: Path,
     data_files: List[Path],
@@ -297,6 +346,7 @@ def process_data_files(
         'all_files': []
     }
 
+    copies: List[Tuple[Path, Path, str]] = []
     for file_path in data_files:
         file_ext = file_path.suffix.lower()
         file_name = file_path.name
@@ -342,9 +392,17 @@ def process_data_files(
                 'extension': file_ext
             })
 
-        # Copy the file
+        copies.append((file_path, destination, file_type))
+
+    # Copy everything first, then record results and delete originals in input order
+    copy_errors = _copy_files([(source, destination) for source, destination, _ in copies])
+
+    for (file_path, destination, file_type), copy_error in zip(copies, copy_errors, strict=True):
+        file_ext = file_path.suffix.lower()
+        file_name = file_path.name
         try:
-            shutil.copy2(file_path, destination)
+            if copy_error is not None:
+                raise copy_error
             processed_info['all_files'].append({
                 'name': file_name,
                 'type': file_type,
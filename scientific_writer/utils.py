@@ -1,5 +1,6 @@
 """Utility functions for scientific writer."""
 
+import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import re
@@ -19,13 +20,16 @@ def find_existing_papers(output_folder: Path) -> List[Dict[str, Any]]:
     if not output_folder.exists():
         return papers
 
-    for paper_dir in output_folder.iterdir():
-        if paper_dir.is_dir():
-            papers.append({
-                'path': paper_dir,
-                'name': paper_dir.name,
-                'mtime': paper_dir.stat().st_mtime
-            })
+    # scandir reports the entry type from the directory listing itself,
+    # so each paper costs a single stat() (for its mtime)
+    with os.scandir(output_folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                papers.append({
+                    'path': Path(entry.path),
+                    'name': entry.name,
+                    'mtime': entry.stat().st_mtime
+                })
 
     # Sort by modification time (most recent first)
     papers.sort(key=lambda x: x['mtime'], reverse=True)
@@ -114,6 +118,11 @@ def detect_paper_reference(user_input: str, existing_papers: List[Dict[str, Any]
     return None
 
 
+# scan_paper_directory entries holding one optional path, and those holding a list of paths.
+_SINGLE_FILE_KEYS = ('tex_final', 'pdf_final', 'bibliography', 'progress_log', 'summary')
+_FILE_LIST_KEYS = ('tex_drafts', 'pdf_drafts', 'figures', 'data', 'sources')
+
+
 def scan_paper_directory(paper_dir: Path) -> Dict[str, Any]:
     """
     Scan a paper directory and collect all file information.
@@ -122,7 +131,8 @@ def scan_paper_directory(paper_dir: Path) -> Dict[str, Any]:
         paper_dir: Path to the paper directory.
 
     Returns:
-        Dictionary with comprehensive file information.
+        Dictionary with comprehensive file information, including a
+        'file_count' total.
     """
     result: Dict[str, Any] = {
         'pdf_final': None,
@@ -135,6 +145,7 @@ def scan_paper_directory(paper_dir: Path) -> Dict[str, Any]:
         'sources': [],
         'progress_log': None,
         'summary': None,
+        'file_count': 0,
     }
 
     if not paper_dir.exists():
@@ -197,6 +208,12 @@ def scan_paper_directory(paper_dir: Path) -> Dict[str, Any]:
     if summary_file.exists():
         result['summary'] = str(summary_file)
 
+    # Total files found, so callers don't have to re-count the entries above
+    result['file_count'] = (
+        sum(1 for key in _SINGLE_FILE_KEYS if result[key])
+        + sum(len(result[key]) for key in _FILE_LIST_KEYS)
+    )
+
     return result
 
 
@@ -1,6 +1,10 @@
 """Tests for scientific_writer.cli."""
 
+import asyncio
+import builtins
 import inspect
+import subprocess
+import sys
 
 from scientific_writer import cli
 
@@ -18,6 +22,15 @@ def test_cli_source_has_no_stale_backend_or_blocking_sleep():
     assert "time.sleep(" not in source, "blocking sleep inside the async event loop"
 
 
+def test_importing_cli_defers_the_agent_sdk_and_dotenv():
+    code = (
+        "import sys, scientific_writer.cli; "
+        "print('claude_agent_sdk' in sys.modules, 'dotenv' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False False"
+
+
 class TestResolveModel:
     def test_default_effort_is_medium_opus(self):
         assert cli._resolve_model() == "claude-opus-4-8"
@@ -30,3 +43,136 @@ class TestResolveModel:
 
     def test_unknown_effort_falls_back_to_medium(self):
         assert cli._resolve_model("turbo") == "claude-opus-4-8"
+
+
+def test_scan_paper_cached_rescans_only_after_changes(tmp_path, monkeypatch):
+    paper_dir = tmp_path / "20250101_120000_demo"
+    (paper_dir / "figures").mkdir(parents=True)
+    (paper_dir / "figures" / "fig1.png").write_bytes(b"")
+    calls = []
+    real_scan = cli.scan_paper_directory
+    monkeypatch.setattr(cli, "scan_paper_directory", lambda d: calls.append(d) or real_scan(d))
+
+    assert cli._scan_paper_cached(paper_dir)["file_count"] == 1
+    assert cli._scan_paper_cached(paper_dir)["file_count"] == 1
+    assert len(calls) == 1
+
+    (paper_dir / "progress.md").write_text("log")
+    assert cli._scan_paper_cached(paper_dir)["file_count"] == 2
+    assert len(calls) == 2
+
+
+def test_create_paper_directory_names_it_after_the_request(tmp_path):
+    paper_dir = cli._create_paper_directory(tmp_path, "Write a paper on CRISPR off-target effects")
+
+    assert paper_dir.parent == tmp_path
+    assert paper_dir.name.endswith("_crispr_off_target_effects")
+    for name in ("drafts", "final", "references", "figures", "data", "sources"):
+        assert (paper_dir / name).is_dir()
+    assert "CRISPR off-target effects" in (paper_dir / "progress.md").read_text()
+
+
+def test_create_paper_directory_never_reuses_an_existing_one(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli.time, "strftime", lambda fmt: "20250101_120000")
+    first = cli._create_paper_directory(tmp_path, "gene drive ecology")
+    (tmp_path / f"{first.name}_2").mkdir()
+
+    second = cli._create_paper_directory(tmp_path, "gene drive ecology")
+
+    assert first.name == "20250101_120000_gene_drive_ecology"
+    assert second.name == "20250101_120000_gene_drive_ecology_3"
+    assert (second / "drafts").is_dir()
+
+
+class TestFindNewPaperDir:
+    def test_single_new_directory_is_used(self, tmp_path):
+        (tmp_path / "20250101_120000_old").mkdir()
+        known = cli._paper_dir_names(tmp_path)
+        (tmp_path / "20250102_120000_fresh").mkdir()
+
+        assert cli._find_new_paper_dir(tmp_path, known, "") == tmp_path / "20250102_120000_fresh"
+
+    def test_reply_disambiguates_several_new_directories(self, tmp_path):
+        known = cli._paper_dir_names(tmp_path)
+        (tmp_path / "20250102_120000_first").mkdir()
+        (tmp_path / "20250102_120500_second").mkdir()
+        reply = "Compiled writing_outputs/20250102_120500_second/final/paper.pdf"
+
+        assert cli._find_new_paper_dir(tmp_path, known, reply) == tmp_path / "20250102_120500_second"
+
+    def test_trailing_sentence_period_is_not_part_of_the_name(self, tmp_path):
+        known = cli._paper_dir_names(tmp_path)
+        (tmp_path / "20250101_120000_foo").mkdir()
+        (tmp_path / "20250101_120500_bar").mkdir()
+        reply = "Draft saved to writing_outputs/20250101_120000_foo."
+
+        assert cli._find_new_paper_dir(tmp_path, known, reply) == tmp_path / "20250101_120000_foo"
+
+    def test_nothing_created_or_mentioned(self, tmp_path):
+        (tmp_path / "20250101_120000_old").mkdir()
+        known = cli._paper_dir_names(tmp_path)
+
+        assert cli._find_new_paper_dir(tmp_path, known, "Here is some advice.") is None
+
+
+class TestSplitNumberedTasks:
+    def test_splits_inline_numbered_list(self):
+        intro, tasks = cli._split_numbered_tasks(
+            "Format in APA: 1. Smith 2020, Nature 5; 2. Doe 2019 3) Lee et al. 2021"
+        )
+        assert intro == "Format in APA:"
+        assert tasks == ["Smith 2020, Nature 5", "Doe 2019", "Lee et al. 2021"]
+
+    def test_numbers_inside_tasks_do_not_split(self):
+        _, tasks = cli._split_numbered_tasks("1. add 2 figures 2. cite 3 papers 3. see section 2. again")
+        assert tasks == ["add 2 figures", "cite 3 papers", "see section 2. again"]
+
+    def test_fewer_than_three_items_is_not_a_batch(self):
+        assert cli._split_numbered_tasks("1. draft intro 2. draft methods") == (
+            "1. draft intro 2. draft methods",
+            [],
+        )
+
+
+def test_print_processed_summary_lists_only_copied_kinds(capsys):
+    cli._print_processed_summary({
+        "manuscript_files": [{"name": "draft.tex"}],
+        "source_files": [],
+        "image_files": [{"name": "a.png"}, {"name": "b.png"}],
+    })
+    assert capsys.readouterr().out == (
+        "   ✓ Copied 1 .tex manuscript(s) to drafts/ [EDITING MODE]\n"
+        "   ✓ Copied 2 image(s) to figures/\n"
+        "   ✓ Deleted original files from data folder\n\n"
+    )
+
+
+class TestStartInput:
+    def test_returns_the_line_read_on_a_daemon_thread(self, monkeypatch):
+        threads = []
+
+        def fake_input(prompt):
+            threads.append(cli.threading.current_thread())
+            return "draft the intro"
+
+        monkeypatch.setattr(builtins, "input", fake_input)
+
+        async def read():
+            return await cli._start_input("> ")
+
+        assert asyncio.run(read()) == "draft the intro"
+        assert threads[0].daemon
+
+    def test_cancelled_wait_keeps_the_pending_line(self, monkeypatch):
+        release = cli.threading.Event()
+        monkeypatch.setattr(builtins, "input", lambda prompt: release.wait() and "later")
+
+        async def read():
+            future = cli._start_input("> ")
+            waiter = asyncio.ensure_future(asyncio.shield(future))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            release.set()
+            return await future
+
+        assert asyncio.run(read()) == "later"
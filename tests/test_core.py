@@ -2,7 +2,8 @@
 
 from pathlib import Path
 
-from scientific_writer.core import setup_claude_skills
+from scientific_writer import core
+from scientific_writer.core import process_data_files, setup_claude_skills
 
 
 def _make_bundled_claude(package_dir: Path, writer_text: str, skill_text: str) -> None:
@@ -79,3 +80,42 @@ def test_missing_bundle_logs_warning_instead_of_silence(tmp_path, caplog):
         setup_claude_skills(package_dir, work_dir)
 
     assert any("claude" in record.message.lower() for record in caplog.records)
+
+
+def test_process_data_files_copies_by_type_and_removes_originals(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    names = ["draft.tex", "notes.md", "results.csv"] + [f"fig{i}.png" for i in range(10)]
+    for name in names:
+        (data_dir / name).write_text(name)
+    files = [data_dir / name for name in names]
+    paper_dir = tmp_path / "paper"
+
+    info = process_data_files(tmp_path, files, str(paper_dir))
+
+    assert [entry["name"] for entry in info["all_files"]] == names
+    assert (paper_dir / "drafts" / "draft.tex").read_text() == "draft.tex"
+    assert (paper_dir / "sources" / "notes.md").exists()
+    assert (paper_dir / "data" / "results.csv").exists()
+    assert len(list((paper_dir / "figures").iterdir())) == 10
+    assert not any(path.exists() for path in files)
+
+
+def test_process_data_files_keeps_originals_and_reports_failures(tmp_path, capsys):
+    present = tmp_path / "results.csv"
+    present.write_text("a,b")
+    missing = tmp_path / "missing.csv"
+
+    info = process_data_files(tmp_path, [present, missing], str(tmp_path / "paper"), delete_originals=False)
+
+    assert [entry["name"] for entry in info["all_files"]] == ["results.csv"]
+    assert present.exists()
+    assert "missing.csv" in capsys.readouterr().out
+
+
+def test_get_api_key_loads_default_dotenv_even_with_explicit_key(monkeypatch):
+    calls = []
+    monkeypatch.setattr(core, "_load_default_dotenv", lambda: calls.append(True))
+
+    assert core.get_api_key("sk-explicit") == "sk-explicit"
+    assert calls == [True]
@@ -0,0 +1,71 @@
+"""Tests for the bundled parallel-web skill script."""
+
+import asyncio
+import importlib.util
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "skills" / "parallel-web" / "scripts" / "parallel_web.py"
+_spec = importlib.util.spec_from_file_location("parallel_web", _SCRIPT)
+parallel_web = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parallel_web)
+
+
+class TestConcurrencyValidation:
+    def test_gather_searches_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            asyncio.run(parallel_web.gather_searches(["topic"], concurrency=0))
+
+    def test_search_batch_rejects_zero_concurrency(self, capsys):
+        parser = parallel_web._build_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(["search-batch", "--concurrency", "0"])
+        assert "must be at least 1" in capsys.readouterr().err
+
+    def test_search_batch_accepts_positive_concurrency(self):
+        args = parallel_web._build_parser().parse_args(["search-batch", "--concurrency", "3"])
+        assert args.concurrency == 3
+
+
+class TestResponseCache:
+    def test_expired_entry_is_a_miss_and_removed(self, tmp_path):
+        cache = parallel_web._ResponseCache(str(tmp_path))
+        key = cache.key("base", None, "question")
+        cache.set(key, {"success": True}, ttl=-1)
+        assert (tmp_path / f"{key}.json").exists()
+        assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_fresh_entry_is_returned(self, tmp_path):
+        cache = parallel_web._ResponseCache(str(tmp_path))
+        key = cache.key("base", None, "question")
+        cache.set(key, {"success": True}, ttl=60)
+        assert cache.get(key) == {"success": True}
+
+
+class TestDaemonRequest:
+    def test_missing_socket_returns_none(self, tmp_path):
+        assert parallel_web._daemon_request(str(tmp_path / "none.sock"), "ping", {}) is None
+
+    def test_truncated_reply_falls_back(self, tmp_path):
+        path = str(tmp_path / "d.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+
+        def reply_truncated():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(65536)
+                conn.sendall(b'{"success": tr')
+
+        thread = threading.Thread(target=reply_truncated)
+        thread.start()
+        try:
+            assert parallel_web._daemon_request(path, "ping", {}) is None
+        finally:
+            thread.join()
+            server.close()
@@ -0,0 +1,110 @@
+"""Tests for the bundled research-lookup skill script."""
+
+import asyncio
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "skills" / "research-lookup" / "research_lookup.py"
+_spec = importlib.util.spec_from_file_location("research_lookup", _SCRIPT)
+research_lookup = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(research_lookup)
+
+
+def _lookup_with_cache(cache_dir: Path):
+    """A ResearchLookup wired to a temporary cache, skipping backend detection."""
+    lookup = research_lookup.ResearchLookup.__new__(research_lookup.ResearchLookup)
+    lookup.cache = research_lookup._ResponseCache(str(cache_dir))
+    lookup.cache_ttl = research_lookup.DEFAULT_CACHE_TTL
+    return lookup
+
+
+class TestResponseCache:
+    def test_expired_entry_is_a_miss_and_removed(self, tmp_path):
+        cache = research_lookup._ResponseCache(str(tmp_path))
+        key = cache.key("parallel-cli", "topic")
+        cache.set(key, {"success": True}, ttl=-1)
+        assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.json").exists()
+
+    def test_recent_queries_get_a_short_ttl(self, tmp_path):
+        lookup = _lookup_with_cache(tmp_path)
+        key = lookup.cache.key("parallel-cli", "latest CRISPR trials")
+        lookup._cache_store(key, {"success": True, "query": "latest CRISPR trials"})
+        expires = research_lookup._json_loads((tmp_path / f"{key}.json").read_bytes())["expires"]
+        assert expires <= time.time() + research_lookup.RECENT_CACHE_TTL
+
+    def test_other_queries_use_the_configured_ttl(self, tmp_path):
+        lookup = _lookup_with_cache(tmp_path)
+        key = lookup.cache.key("parallel-cli", "CRISPR mechanism")
+        lookup._cache_store(key, {"success": True, "query": "CRISPR mechanism"})
+        expires = research_lookup._json_loads((tmp_path / f"{key}.json").read_bytes())["expires"]
+        assert expires > time.time() + research_lookup.RECENT_CACHE_TTL
+
+
+class _FakeCompletions:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+class TestParallelChatLookup:
+    def test_default_lookup_reads_basis_from_complete_response(self, tmp_path):
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Report"))],
+            basis=[{"citations": [{"url": "https://example.org/a", "title": "A"}]}],
+        )
+        completions = _FakeCompletions(response)
+        lookup = _lookup_with_cache(tmp_path)
+        lookup._get_chat_client = lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        result = lookup._parallel_chat_lookup("comprehensive review of topic")
+
+        assert completions.calls[0]["stream"] is False
+        assert result["response"] == "Report"
+        assert [s["url"] for s in result["sources"]] == ["https://example.org/a"]
+
+    def test_default_lookup_tolerates_a_response_without_choices(self, tmp_path):
+        completions = _FakeCompletions(SimpleNamespace(choices=[], basis=None))
+        lookup = _lookup_with_cache(tmp_path)
+        lookup._get_chat_client = lambda: SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        result = lookup._parallel_chat_lookup("comprehensive review of topic")
+
+        assert result["success"]
+        assert result["response"] == ""
+
+
+def test_async_cli_search_timeout_reaps_the_child_and_explains(tmp_path, monkeypatch):
+    out_path = tmp_path / "out.json"
+    out_path.write_text("")
+    lookup = _lookup_with_cache(tmp_path)
+    lookup._parallel_cli_command = lambda *args: ([sys.executable, "-c", "import time; time.sleep(30)"], str(out_path))
+    monkeypatch.setattr(research_lookup, "PARALLEL_CLI_TIMEOUT", 0.2)
+
+    with pytest.raises(RuntimeError, match="timed out after 0.2s"):
+        asyncio.run(lookup._run_parallel_cli_search_async("topic"))
+    assert not out_path.exists()
+
+def test_batch_lookup_async_spaces_out_starts(tmp_path):
+    starts = []
+
+    async def fake_lookup(query):
+        starts.append(time.monotonic())
+        return {"success": True, "query": query}
+
+    lookup = _lookup_with_cache(tmp_path)
+    lookup.lookup_async = fake_lookup
+    results = asyncio.run(lookup.batch_lookup_async(["a", "b", "c"], concurrency=3, delay=0.05))
+
+    assert [r["query"] for r in results] == ["a", "b", "c"]
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+    assert all(gap >= 0.045 for gap in gaps)
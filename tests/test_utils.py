@@ -1,10 +1,13 @@
 """Tests for scientific_writer.utils."""
 
+import os
 
 from scientific_writer.utils import (
     count_citations_in_bib,
     detect_paper_reference,
     extract_citation_style,
+    find_existing_papers,
+    scan_paper_directory,
 )
 
 
@@ -56,3 +59,31 @@ def test_count_citations_in_bib(tmp_path):
     bib.write_text("@article{a, title={A}}\n@book{b, title={B}}\n")
     assert count_citations_in_bib(str(bib)) == 2
     assert count_citations_in_bib(None) == 0
+
+
+def test_find_existing_papers_lists_dirs_most_recent_first(tmp_path):
+    older = tmp_path / "20250101_120000_older"
+    newer = tmp_path / "20250102_120000_newer"
+    older.mkdir()
+    newer.mkdir()
+    (tmp_path / "notes.txt").write_text("not a paper")
+    os.utime(older, (1_000_000, 1_000_000))
+
+    papers = find_existing_papers(tmp_path)
+
+    assert [paper["name"] for paper in papers] == [newer.name, older.name]
+    assert papers[0]["path"] == newer
+    assert papers[1]["mtime"] == 1_000_000
+
+
+def test_scan_paper_directory_counts_files(tmp_path):
+    for relative in ("final/paper.pdf", "drafts/v1_draft.tex", "drafts/v2_draft.tex",
+                     "references/references.bib", "figures/fig1.png", "progress.md"):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    info = scan_paper_directory(tmp_path)
+
+    assert info["file_count"] == 6
+    assert scan_paper_directory(tmp_path / "missing")["file_count"] == 0